@@ -0,0 +1,74 @@
+import logging
+
+import pytest
+
+from xcon.serverless_files.config_manager.change_handler import (
+    ssm_or_secrets_change_event,
+    _path_from_detail,
+    _parse_path,
+)
+
+SECRET_ARN = 'arn:aws:secretsmanager:us-east-1:972731226928:secret:/test/prod/experiment-2-Pwqh7v'
+
+
+@pytest.mark.parametrize(
+    "detail, expected_path",
+    [
+        # SSM parameter change
+        ({'name': '/auth/dev/db_port'}, '/auth/dev/db_port'),
+        # Secrets Manager events, via CloudTrail
+        ({'responseElements': {'name': '/test/prod/experiment-2'}}, '/test/prod/experiment-2'),
+        ({'requestParameters': {'name': '/test/prod/experiment-2'}}, '/test/prod/experiment-2'),
+        ({'requestParameters': {'secretId': SECRET_ARN}}, SECRET_ARN),
+        ({'requestParameters': {'secretId': '/test/dev/experiment-2'}}, '/test/dev/experiment-2'),
+        # `name` is preferred over `secretId`, and empty/non-dict values are skipped.
+        ({'requestParameters': {'name': '/a/b', 'secretId': '/z/q'}}, '/a/b'),
+        ({'name': '', 'responseElements': None, 'requestParameters': {'secretId': '/a/b'}},
+         '/a/b'),
+        ({'responseElements': 'not-a-dict'}, None),
+        ({}, None),
+    ]
+)
+def test_path_from_detail(detail, expected_path):
+    assert _path_from_detail(detail) == expected_path
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ('/auth/dev/db_port', ('/auth/dev/db_port', '/auth/dev', 'db_port')),
+        ('/test/dev/experiment-2', ('/test/dev/experiment-2', '/test/dev', 'experiment-2')),
+        # The ARN parts and the `-` suffix secrets manager adds to the name are removed.
+        (SECRET_ARN, ('/test/prod/experiment-2', '/test/prod', 'experiment-2')),
+    ]
+)
+def test_parse_path(path, expected):
+    assert _parse_path(path) == expected
+
+
+@pytest.mark.parametrize("path", ['db_port', 'arn:aws:secretsmanager:us-east-1:1:secret:name-Pw'])
+def test_parse_path_without_directory_raises(path):
+    with pytest.raises(ValueError, match="did not have at least two path components"):
+        _parse_path(path)
+
+
+def test_change_event_logs_query(caplog):
+    event = {
+        'source': 'aws.secretsmanager',
+        'detail': {'requestParameters': {'secretId': SECRET_ARN}},
+    }
+    with caplog.at_level(logging.INFO):
+        ssm_or_secrets_change_event(event, None)
+
+    record = caplog.records[-1]
+    assert record.path == '/test/prod/experiment-2'
+    assert record.query == {
+        'real_name': 'experiment-2',
+        'real_directory': ['/_nonExistent', '/test/prod'],
+    }
+
+
+@pytest.mark.parametrize("event", [{}, {'detail': None}, {'detail': {'name': ''}}])
+def test_change_event_without_path_raises(event):
+    with pytest.raises(AttributeError, match="Could not find attribute with a path"):
+        ssm_or_secrets_change_event(event, None)
@@ -1,21 +1,28 @@
 import datetime as dt
 import functools
+import gc
 import os
+import subprocess
+import sys
+import threading
 import time
+import weakref
 from typing import Type
 from xcon import xcon_settings
 
 from xcon.providers.common import AwsProvider
 
 from xboto import boto_clients
+from xboto.dependencies import BotoResources
 import moto
 import pytest
+import xcon
 from xsentinels import Default
 from xloop import xloop
 
 from xcon import Config, config
-from xcon.directory import DirectoryItem, Directory
-from xcon.provider import ProviderCacher, InternalLocalProviderCache
+from xcon.directory import DirectoryItem, Directory, DirectoryChain
+from xcon.provider import ProviderCacher, InternalLocalProviderCache, ProviderChain
 from xcon.providers import (
     EnvironmentalProvider,
     DynamoProvider,
@@ -23,7 +30,9 @@ from xcon.providers import (
     SecretsManagerProvider,
     DynamoCacher
 )
-from xcon.providers.dynamo import _ConfigDynamoTable
+from xcon.providers import dynamo
+from xcon.providers.dynamo import _ConfigDynamoTable, DynamoDBResource, _read_disk_cache
+from xcon.providers.environmental import _EnvListing
 
 DEFAULT_TESTING_PROVIDERS = [EnvironmentalProvider, SecretsManagerProvider, SsmParamStoreProvider]
 
@@ -491,6 +500,20 @@ def test_secrets_manager_provider_case_insensative():
     assert config.get_value('MY_SECRET') == 'my-secret-value'
 
 
+def test_secrets_manager_provider_several_secrets_in_directory():
+    config.providers = [EnvironmentalProvider, SecretsManagerProvider]
+    for name in ('first_secret', 'second_secret', 'third_secret'):
+        boto_clients.secretsmanager.create_secret(
+            Name=f'/testing/unit/{name}',
+            SecretString=f'{name}-value',
+        )
+
+    assert config.get_value('second_secret') == 'second_secret-value'
+    assert config.get_value('first_secret') == 'first_secret-value'
+    assert config.get_value('third_secret') == 'third_secret-value'
+    assert config.get_value('fourth_secret') is None
+
+
 @Config(providers=DEFAULT_TESTING_PROVIDERS, cacher=DynamoCacher)
 def test_expire_internal_local_cache(directory: Directory):
     # Basic defaults-test.
@@ -668,3 +691,389 @@ def test_directory_order_followed():
     assert config['testv'] == "/s/e"
 
 
+def test_env_provider_creates_items_when_needed():
+    listing = _EnvListing(env_vars={'SOME_VAR': 'some-value'}, source='env')
+    assert not listing._items
+    assert listing.get_item('Some_Var').value == 'some-value'
+    assert list(listing._items) == ['some_var']
+
+    provider = EnvironmentalProvider(env_vars={'SOME_VAR': 'some-value', 'other_var': 'other'})
+    listing = provider.local_cache
+    item = provider.get_item_without_environ('some_var')
+    assert item.value == 'some-value'
+    assert item.original_name == 'SOME_VAR'
+    assert provider.get_item_without_environ('SOME_VAR') is item
+    assert provider.get_value_without_environ('OTHER_VAR') == 'other'
+    # Getting just the value does not need the item.
+    assert 'other_var' not in listing._items
+    assert provider.get_value_without_environ('not_there') is None
+    assert provider.get_item_without_environ('not_there') is None
+    assert set(listing.item_mapping()) == {'some_var', 'other_var'}
+
+
+def test_env_provider_reuses_unchanged_environ_snapshot():
+    provider = EnvironmentalProvider()
+    listing = provider.local_cache
+
+    # Nothing changed, the next snapshot shares the same variables (but is it's own listing).
+    InternalLocalProviderCache.grab().reset_cache()
+    assert provider.local_cache is not listing
+    assert provider.local_cache._env_vars is listing._env_vars
+
+    try:
+        os.environ['XCON_SNAPSHOT_TEST_VAR'] = 'changed'
+        InternalLocalProviderCache.grab().reset_cache()
+        assert provider.local_cache._env_vars is not listing._env_vars
+        assert provider.get_value_without_environ('xcon_snapshot_test_var') == 'changed'
+
+        # Removing an item from one listing does not remove it from any others.
+        other_provider = EnvironmentalProvider()
+        other_provider.local_cache.remove_item_with_name('xcon_snapshot_test_var')
+        assert other_provider.get_value_without_environ('xcon_snapshot_test_var') is None
+        assert provider.get_value_without_environ('xcon_snapshot_test_var') == 'changed'
+    finally:
+        del os.environ['XCON_SNAPSHOT_TEST_VAR']
+
+
+def test_non_existent_items_keep_their_own_locations_searched():
+    chain = ProviderChain([EnvironmentalProvider(env_vars={})])
+    first = chain.get_item('not_there', directory_chain=DirectoryChain(['/a/b']))
+    second = chain.get_item('not_there', directory_chain=DirectoryChain(['/c/d']))
+    assert first.value is None and second.value is None
+    assert first is not second
+    assert list(first.supplemental_metadata['locations_searched']) != list(
+        second.supplemental_metadata['locations_searched']
+    )
+
+
+def test_internal_cache_released_with_provider():
+    cache = InternalLocalProviderCache.grab()
+    provider = EnvironmentalProvider(env_vars={'SOME_VAR': 'some-value'})
+    cache.set_cache_for_provider(provider=provider, cache={'a': 1})
+    assert cache.get_cache_for_provider(provider=provider, cache_constructor=None) == {'a': 1}
+
+    count = len(cache._local_internal_cache)
+    del provider
+    gc.collect()
+    assert len(cache._local_internal_cache) == count - 1
+
+
+def test_internal_cache_constructed_once_for_concurrent_threads():
+    cache = InternalLocalProviderCache.grab()
+    provider = EnvironmentalProvider(env_vars={})
+    constructed = []
+
+    def constructor(_):
+        constructed.append(1)
+        time.sleep(0.05)
+        return {'constructed': len(constructed)}
+
+    results = []
+
+    def get_cache():
+        results.append(
+            cache.get_cache_for_provider(provider=provider, cache_constructor=constructor)
+        )
+
+    threads = [threading.Thread(target=get_cache) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(constructed) == 1
+    assert len(results) == 5
+    assert all(r is results[0] for r in results)
+
+
+def test_dynamo_provider_prefetches_rest_of_directory_chain(dynamo_provider_table):
+    for path, name in [('/a/b', 'x'), ('/c/d', 'y')]:
+        dynamo_provider_table.put_item(Item={
+            'app_key': path, 'name_key': name,
+            'directory': path, 'name': name, 'value': f'{name}-{path[-1]}',
+        })
+
+    provider = DynamoProvider.grab()
+    chain = DirectoryChain(directories=['/a/b', '/c/d', '/e/f'])
+    item = provider.get_item(
+        name='x', directory='/a/b', directory_chain=chain, provider_chain=None, environ=None
+    )
+    assert item.value == 'x-b'
+
+    # The other directories in the chain were retrieved at the same time.
+    assert provider.retrieved_items_map('/c/d')['y'].value == 'y-d'
+    assert provider.retrieved_items_map('/e/f') == {}
+
+
+def test_ssm_provider_prefetches_rest_of_directory_chain():
+    for path, name in [('/a/b', 'x'), ('/c/d', 'y')]:
+        boto_clients.ssm.put_parameter(
+            Name=f'{path}/{name}', Value=f'{name}-{path[-1]}', Type="String"
+        )
+
+    provider = SsmParamStoreProvider.grab()
+    chain = DirectoryChain(directories=['/a/b', '/c/d', '/e/f'])
+    item = provider.get_item(
+        name='x', directory='/a/b', directory_chain=chain, provider_chain=None, environ=None
+    )
+    assert item.value == 'x-b'
+
+    # The other directories in the chain were retrieved at the same time.
+    assert provider.retrieved_items_map('/c/d')['y'].value == 'y-d'
+    assert provider.retrieved_items_map('/e/f') == {}
+
+
+def test_dynamo_table_put_items_in_batches():
+    table = _ConfigDynamoTable(table_name='global-all-configCache', cache_table=True)
+    items = [
+        DirectoryItem(
+            directory='/a/b', name=f'name-{i}', value=f'value-{i}', cache_hash_key='/a/b',
+            cache_range_key=f'name-{i}'
+        )
+        for i in range(60)
+    ]
+    # Same key as the first one, should replace it.
+    items.append(DirectoryItem(
+        directory='/a/b', name='name-0', value='new-value', cache_hash_key='/a/b',
+        cache_range_key='name-0'
+    ))
+    table.put_items(items)
+
+    found = {i.name: i.value for i in table.get_all_items()}
+    assert len(found) == 60
+    assert found['name-0'] == 'new-value'
+    assert found['name-59'] == 'value-59'
+
+    # Parallel segment scans find the same items.
+    assert {i.name: i.value for i in table.get_all_items(total_segments=3)} == found
+
+
+@Config(providers=DEFAULT_TESTING_PROVIDERS, cacher=DynamoCacher)
+def test_dynamo_cacher_disk_cache(directory: Directory, tmp_path):
+    xcon_settings.dynamo_cacher_disk_cache_dir = str(tmp_path)
+    boto_clients.ssm.put_parameter(
+        Name=f'{directory.path}/disk_cached_value', Value="diskValue", Type="String"
+    )
+    # Nothing in the cache table or disk cache yet; this will look it up and cache it.
+    assert config.get('disk_cached_value') == 'diskValue'
+
+    # Cache table is read (and written out to disk) on the next lookup in a new internal cache.
+    InternalLocalProviderCache.grab().reset_cache()
+    assert config.get('disk_cached_value') == 'diskValue'
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # Remove it from everywhere except the disk cache, we should still get it from there.
+    boto_clients.ssm.delete_parameter(Name=f'{directory.path}/disk_cached_value')
+    table = _ConfigDynamoTable(table_name='global-all-configCache', cache_table=True)
+    table.delete_items(table.get_all_items())
+    InternalLocalProviderCache.grab().reset_cache()
+    item = config.get_item('disk_cached_value')
+    assert item.value == 'diskValue'
+    assert item.from_cacher
+
+
+def test_secrets_manager_provider_lists_secrets_again_after_reset():
+    config.providers = [EnvironmentalProvider, SecretsManagerProvider]
+    boto_clients.secretsmanager.create_secret(
+        Name='/testing/unit/first_secret', SecretString='first-value'
+    )
+    assert config.get_value('first_secret') == 'first-value'
+
+    # Another provider instance uses the names already listed via `list_secrets`.
+    other_provider = SecretsManagerProvider()
+    assert other_provider._available_names_for_directory() is (
+        SecretsManagerProvider.grab()._available_names_for_directory()
+    )
+
+    boto_clients.secretsmanager.create_secret(
+        Name='/testing/unit/second_secret', SecretString='second-value'
+    )
+
+    # A new internal/local cache lists them again, so it finds the new secret.
+    InternalLocalProviderCache.grab().reset_cache()
+    assert config.get_value('first_secret') == 'first-value'
+    assert config.get_value('second_secret') == 'second-value'
+
+
+def test_secrets_manager_provider_only_stops_batch_get_when_not_allowed(monkeypatch):
+    from botocore.exceptions import ClientError
+    for name in ('first_secret', 'second_secret'):
+        boto_clients.secretsmanager.create_secret(
+            Name=f'/testing/unit/{name}',
+            SecretString=f'{name}-value',
+        )
+
+    def batch_get_error(code):
+        def batch_get_secret_value(**kwargs):
+            raise ClientError({'Error': {'Code': code}}, 'BatchGetSecretValue')
+        return batch_get_secret_value
+
+    provider = SecretsManagerProvider()
+    directory = Directory.from_path('/testing/unit')
+    client = boto_clients.secretsmanager
+
+    # Could be transient, we will try it again next time.
+    monkeypatch.setattr(client, 'batch_get_secret_value', batch_get_error('ThrottlingException'))
+    assert provider.prefetch_values(directory) is None
+    assert not provider._batch_get_failed
+
+    monkeypatch.setattr(client, 'batch_get_secret_value', batch_get_error('AccessDeniedException'))
+    assert provider.prefetch_values(directory) is None
+    assert provider._batch_get_failed
+
+
+@pytest.mark.parametrize('contents', [
+    'not json', '[]', '{"expires_at": "soon"}', '{"expires_at": 9999999999}',
+    '{"expires_at": 9999999999, "items": [1]}', '{"expires_at": 9999999999, "items": [{}]}',
+])
+def test_dynamo_cacher_ignores_malformed_disk_cache(tmp_path, contents):
+    path = tmp_path / 'cache.json'
+    path.write_text(contents)
+    assert _read_disk_cache(path, expire_time=dt.datetime.now(dt.timezone.utc)) == (None, 0)
+
+
+def test_dynamo_table_drops_items_still_unprocessed_after_retries(monkeypatch, caplog):
+    table = _ConfigDynamoTable(table_name='global-all-configCache', cache_table=True)
+    requests = [{'PutRequest': {'Item': {'app_key': '/a/b', 'name_key': 'name'}}}]
+
+    class ThrottledClient:
+        calls = 0
+
+        def batch_write_item(self, RequestItems):
+            self.calls += 1
+            return {'UnprocessedItems': RequestItems}
+
+    client = ThrottledClient()
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    # It's only a cache, so we give up on them (vs failing the config lookup).
+    table._batch_write(client, requests)
+    assert client.calls > 1
+    assert 'dropping them' in caplog.text
+
+
+def test_aws_provider_local_cache_expires_when_used_directly():
+    provider = SsmParamStoreProvider()
+    local_cache = provider.local_cache
+    assert provider.local_cache is local_cache
+
+    InternalLocalProviderCache.grab().expire_time_delta = dt.timedelta(milliseconds=1)
+    time.sleep(0.01)
+    assert provider.local_cache is not local_cache
+
+
+def test_dynamo_cacher_disk_cache_file_is_per_table(directory: Directory, tmp_path, monkeypatch):
+    xcon_settings.dynamo_cacher_disk_cache_dir = str(tmp_path)
+    cacher = DynamoCacher()
+    path = cacher._disk_cache_path(directory)
+    assert path.parent == tmp_path
+
+    monkeypatch.setattr(
+        DynamoCacher, '_table', property(lambda self: _ConfigDynamoTable(table_name='other'))
+    )
+    assert cacher._disk_cache_path(directory) not in (path, None)
+
+
+def test_interned_provider_chain_released_with_internal_cache():
+    provider = EnvironmentalProvider(env_vars={})
+    chain = ProviderChain.interned([provider])
+    assert ProviderChain.interned([provider]) is chain
+
+    provider_ref = weakref.ref(provider)
+    del provider, chain
+    InternalLocalProviderCache.grab().reset_cache()
+    gc.collect()
+    assert provider_ref() is None
+
+
+def test_secrets_manager_provider_prefetches_directory_only_when_enabled(monkeypatch):
+    config.providers = [EnvironmentalProvider, SecretsManagerProvider]
+    for name in ('First_Secret', 'second_secret'):
+        boto_clients.secretsmanager.create_secret(
+            Name=f'/testing/unit/{name}', SecretString=f'{name}-value',
+        )
+
+    batch_calls = []
+
+    def batch_get_secret_value(SecretIdList):
+        batch_calls.append(SecretIdList)
+        return {'SecretValues': [
+            {'Name': path, 'SecretString': f'{path.rpartition("/")[2]}-batched'}
+            for path in SecretIdList
+        ]}
+
+    monkeypatch.setattr(
+        boto_clients.secretsmanager, 'batch_get_secret_value', batch_get_secret_value
+    )
+
+    # By default, only what is asked for is retrieved.
+    assert config.get_value('first_secret') == 'First_Secret-value'
+    assert not batch_calls
+
+    xcon_settings.secrets_manager_prefetch_directory = True
+    InternalLocalProviderCache.grab().reset_cache()
+    item = config.get_item('first_secret')
+    assert item.value == 'First_Secret-batched'
+    assert item.original_name == 'First_Secret'
+    assert len(batch_calls) == 1
+
+
+def test_pytest_plugin_baseline_when_loaded_from_conftest(tmp_path):
+    # Projects often load the plugin via `pytest_plugins` in their conftest.py instead of
+    # the entry-point; the base-line must still be in place when test modules are imported.
+    (tmp_path / 'conftest.py').write_text("pytest_plugins = ['xcon.pytest_plugin']\n")
+    (tmp_path / 'test_baseline.py').write_text(
+        'from xcon import xcon_settings\n'
+        'from xcon.providers import EnvironmentalProvider\n'
+        'providers_at_import_time = tuple(xcon_settings.providers)\n'
+        '\n'
+        'def test_baseline():\n'
+        '    assert providers_at_import_time == (EnvironmentalProvider,)\n'
+        '    assert tuple(xcon_settings.providers) == (EnvironmentalProvider,)\n'
+    )
+    xcon_root = os.path.dirname(os.path.dirname(os.path.abspath(xcon.__file__)))
+    env = {**os.environ, 'PYTHONPATH': xcon_root}
+    result = subprocess.run(
+        [sys.executable, '-m', 'pytest', '-q', '-p', 'no:cacheprovider', str(tmp_path)],
+        cwd=tmp_path, env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+@Config(providers=DEFAULT_TESTING_PROVIDERS, cacher=DynamoCacher)
+def test_dynamo_cacher_uses_dax_client_when_endpoint_set(directory: Directory, monkeypatch):
+    dax_calls = []
+
+    class FakeDaxClient:
+        # Stands in for `amazondax.AmazonDaxClient`, forwarding to the (moto) dynamo client.
+        def __init__(self, endpoint_url):
+            dax_calls.append(('client', endpoint_url))
+            self._client = boto_clients.dynamodb
+
+        def query(self, **kwargs):
+            dax_calls.append(('query', kwargs['TableName']))
+            return self._client.query(**kwargs)
+
+        @classmethod
+        def resource(cls, endpoint_url):
+            dax_calls.append(('resource', endpoint_url))
+            return BotoResources.grab().dynamodb
+
+    monkeypatch.setattr(dynamo, '_dax_client_class', lambda endpoint_url: FakeDaxClient)
+
+    boto_clients.ssm.put_parameter(Name=f'{directory.path}/dax_value', Value="v", Type="String")
+
+    # Not set by default, dynamo is used directly.
+    assert config.get('dax_value') == 'v'
+    assert dax_calls == []
+    assert not isinstance(DynamoDBResource.grab().raw_client(), FakeDaxClient)
+
+    endpoint = 'dax://my-cluster.abc123.dax-clusters.us-east-1.amazonaws.com'
+    xcon_settings.dynamo_dax_endpoint = endpoint
+    InternalLocalProviderCache.grab().reset_cache()
+
+    # The endpoint is checked when a new `DynamoDBResource` first needs a client/table.
+    with DynamoDBResource():
+        assert config.get('dax_value') == 'v'
+        assert ('client', endpoint) in dax_calls
+        assert ('query', 'global-all-configCache') in dax_calls
+        assert isinstance(DynamoDBResource.grab().raw_client(), FakeDaxClient)
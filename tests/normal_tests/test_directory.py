@@ -1,6 +1,8 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
-from xcon.directory import Directory
+from xcon.directory import Directory, DirectoryItem, DirectoryListing
 from xcon.exceptions import ConfigError
 
 
@@ -53,3 +55,62 @@ def test_directory_checks_format_keys():
     # Also check to see if exception message contains some reasonable information in it.
     with pytest.raises(ConfigError, match=r'unknown format.+unknown_format_key.+/some-more-path'):
         Directory(path='/{unknown_format_key}/some-more-path')
+
+
+def test_directory_is_immutable_and_compares_by_path():
+    directory = Directory(service='my-service', env='my-env')
+    assert directory == Directory(path='/my-service/my-env')
+    assert hash(directory) == hash(Directory(path='/my-service/my-env'))
+    assert directory != Directory(path='/my-service/other-env')
+
+    with pytest.raises(FrozenInstanceError):
+        directory.path = '/some/other/path'
+
+    item = DirectoryItem(directory='/my-service/my-env', name='Some_Name', value='a-value')
+    assert item.directory is Directory.from_path('/my-service/my-env')
+    assert item.name == 'some_name'
+    assert item.original_name == 'Some_Name'
+
+    with pytest.raises(FrozenInstanceError):
+        item.value = 'another-value'
+
+
+def test_from_path_returns_standard_directory():
+    directory = Directory.from_path('/interned-service/interned-env')
+    assert Directory.from_path('/interned-service/interned-env') is directory
+    assert Directory.from_components('interned-service', 'interned-env') is directory
+
+    Directory.clear_cache()
+    assert Directory.from_path('/interned-service/interned-env') is not directory
+
+
+def test_listing_add_items():
+    listing = DirectoryListing(items=[DirectoryItem(directory='/a', name='one', value='1')])
+    listing.add_items(
+        DirectoryItem(directory='/a', name=name, value=value)
+        for name, value in [('ONE', 'new-1'), ('two', '2')]
+    )
+    # Names are lower-cased, so the later `ONE` replaces `one`.
+    assert listing.get_item('one').value == 'new-1'
+    assert listing.get_item('TWO').value == '2'
+    assert len(listing.item_mapping()) == 2
+
+
+def test_listing_with_item_map():
+    item = DirectoryItem(directory='/a', name='One', value='1')
+    item_map = {item.name: item}
+    listing = DirectoryListing(item_map=item_map)
+    assert listing.get_item('ONE') is item
+
+    # The listing uses the passed in dict as-is.
+    listing.add_item(DirectoryItem(directory='/a', name='two', value='2'))
+    assert item_map['two'].value == '2'
+
+
+def test_item_supplemental_metadata_is_a_dict():
+    item = DirectoryItem(directory='/a', name='one', value='1')
+    item.supplemental_metadata['some_key'] = 'some-value'
+    assert item.supplemental_metadata == {'some_key': 'some-value'}
+
+    # Each item gets it's own.
+    assert DirectoryItem(directory='/a', name='two', value='2').supplemental_metadata == {}
@@ -74,3 +74,19 @@ def test_providers_is_ok_without_region(provider_type: Type[AwsProvider]):
         del os.environ['AWS_CONFIG_FILE']
         if old_region is not None:
             os.environ['AWS_DEFAULT_REGION'] = old_region
+
+
+@pytest.mark.parametrize(
+    "error_code", ['UnrecognizedClientException', 'ExpiredTokenException']
+)
+def test_handle_aws_exception_ignores_credential_error_codes(error_code):
+    from botocore.exceptions import ClientError
+    from xcon.providers.common import handle_aws_exception
+
+    provider = SsmParamStoreProvider()
+    directory = Directory.from_path("/a/b")
+    exception = ClientError({'Error': {'Code': error_code}}, 'GetParametersByPath')
+
+    # Should log a warning and mark the directory as errored, instead of raising.
+    handle_aws_exception(exception, provider, directory)
+    assert provider.directory_has_error(directory)
@@ -104,6 +104,59 @@ class XconSettings(_Settings):
           `cacher` = `xcon.providers.dynamo.DynamoCacher`).
     """
 
+    dynamo_dax_endpoint: Optional[str] = SettingsField(
+        name='XCON_DYNAMO_DAX_ENDPOINT', retriever=_env_retriever, default_value=None
+    )
+    """ Defaults to `XCON_DYNAMO_DAX_ENDPOINT` environment variable.
+
+        If set, the dynamo provider/cacher tables are queried though this DynamoDB Accelerator
+        (DAX) cluster endpoint (ie: `dax://my-cluster.abc123.dax-clusters.us-east-1.amazonaws.com`)
+        instead of going to DynamoDB directly. Requires the `amazon-dax-client` package.
+
+        If not set (default), DynamoDB is used directly.
+
+        This is checked the first time a table is needed by the current
+        `xcon.providers.dynamo.DynamoDBResource`; it's not used if you gave that resource
+        a `dynamodb_xboto_resource` explicitly.
+    """
+
+    dynamo_cacher_disk_cache_dir: Optional[str] = SettingsField(
+        name='XCON_DYNAMO_CACHER_DISK_CACHE_DIR', retriever=_env_retriever, default_value=None
+    )
+    """ Defaults to `XCON_DYNAMO_CACHER_DISK_CACHE_DIR` environment variable.
+
+        If set, `xcon.providers.dynamo.DynamoCacher` also keeps what it retrieves from the
+        dynamo cache table in files in this directory, and will use them (instead of querying
+        the cache table) in other processes for as long as the internal/local cache would
+        (see `xcon.provider.InternalLocalProviderCache.expire_time_delta`).
+
+        This helps short-lived processes that start often (ie: lambdas, command-line tools),
+        `tempfile.gettempdir()` is a good choice for those.
+
+        Warning: The files have the resolved config values in them, in plaintext; this includes
+        secrets from `xcon.providers.secrets_manager.SecretsManagerProvider`. They are only
+        readable by the user that wrote them, but only use a directory you would be ok with
+        having the secrets in.
+
+        If not set (default), nothing is written to disk.
+    """
+
+    secrets_manager_prefetch_directory: bool = SettingsField(
+        name='XCON_SECRETS_MANAGER_PREFETCH_DIRECTORY', retriever=_env_retriever,
+        default_value=False
+    )
+    """ Defaults to `XCON_SECRETS_MANAGER_PREFETCH_DIRECTORY` environment variable.
+
+        If `True`: The first time `xcon.providers.secrets_manager.SecretsManagerProvider`
+        needs a value from a directory, it gets the values of all the secrets in that
+        directory in one go (via `batch_get_secret_value`, which needs the
+        `secretsmanager:BatchGetSecretValue` permission); instead of one call per secret.
+        Keep in mind this also gets the values of secrets that are never asked for.
+
+        If `False` (default): Only the values that are asked for are retrieved,
+        one at a time.
+    """
+
     providers: Sequence[Type[Provider]] = (
         providers.EnvironmentalProvider,
         providers.SsmParamStoreProvider,
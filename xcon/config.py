@@ -11,6 +11,7 @@ Very quick example, this will grab `SOME_CONFIG_ATTR` for you:
 
 """
 import os
+import threading
 from copy import copy
 from dataclasses import dataclass, field
 from inspect import isclass
@@ -38,14 +39,14 @@ from .provider import Provider, ProviderChain, ProviderCacher, InternalLocalProv
 from .providers import EnvironmentalProvider
 from .providers.dynamo import DynamoCacher
 
-from xcon.conf import xcon_settings
+from xcon.conf import xcon_settings, XconSettings
 
 xlog = getLogger(__name__)
 
 T = TypeVar('T')
 
 
-@dataclass(frozen=True, eq=False)
+@dataclass(frozen=True, eq=False, slots=True)
 class _ParentCursor:
     parent: "Config"
     index: int
@@ -61,7 +62,7 @@ class _ParentCursor:
         return _ParentCursor(parent=next_config, index=next_index, chain=chain)
 
 
-@dataclass(frozen=True, eq=True)
+@dataclass(frozen=True, eq=True, slots=True)
 class _ParentChain:
     parents: Tuple["Config"] = field(default_factory=list)
 
@@ -82,6 +83,45 @@ class _ParentChain:
         return _ParentCursor(parent=parents[0], index=0, chain=self)
 
 
+class _SettingsSnapshot:
+    """ The `xcon.conf.XconSettings` values used while resolving a config value.
+
+        Reading an attribute off of `xcon_settings` goes though the settings proxy/retriever
+        every time; during a single resolve we read the same few settings many times.
+        `Config.get_item` puts one of these in place for the resolve, and everything that
+        reads a setting while resolving goes though it via `_resolve_settings`.
+
+        A setting is read from `xcon_settings` the first time it's asked for, and that same
+        value is then used for the rest of the resolve.
+    """
+    __slots__ = ('_values',)
+
+    def __init__(self):
+        self._values = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the settings, `_values` is found normally (via the slot).
+        values = self._values
+        try:
+            return values[name]
+        except KeyError:
+            value = values[name] = getattr(xcon_settings, name)
+            return value
+
+
+_resolve_local = threading.local()
+""" Holds the `_SettingsSnapshot` for the resolve currently in progress on this thread
+    (as `settings` attribute), see `Config.get_item`.
+"""
+
+
+def _resolve_settings() -> Union[_SettingsSnapshot, XconSettings]:
+    """ Returns the settings snapshot for the resolve in progress on the current thread,
+        or the live `xcon_settings` if we are not in the middle of resolving a value.
+    """
+    return getattr(_resolve_local, 'settings', None) or xcon_settings
+
+
 def _check_proper_cacher_or_raise_error(cacher):
     """ Checks if passed-in value is a proper cacher value from user to Config;
         otherwise we raise an error.
@@ -327,7 +367,7 @@ class Config(Dependency):
         self._defaults = DirectoryListing()
 
         # By default, we grab the ones from the parent chain and use them.
-        self._exports: Dict[Union[DefaultType, str], None] = {Default: None}
+        self._exports: OrderedDefaultSet[str] = OrderedSet.fromkeys((Default,))
 
         self._use_parent = use_parent
 
@@ -339,7 +379,7 @@ class Config(Dependency):
 
         # This property will lazily be used to create self.provider_chain when the chain
         # is requested for the first time.
-        self._providers = {x: None for x in xloop(providers, default_not_iterate=[str])}
+        self._providers = OrderedSet.fromkeys(xloop(providers, default_not_iterate=[str]))
 
         # We lazy-lookup cacher if it's Default or a Type.
         # See 'self.cacher' property.
@@ -385,11 +425,11 @@ class Config(Dependency):
             when you ask for the `Config.directory_chain`.
         """
         # make an ordered-set out of this.
-        dirs: OrderedDefaultSet = {}
+        dirs: OrderedDefaultSet[Directory] = OrderedSet()
         for x in xloop(value, default_not_iterate=[str]):
             if x is not Default:
                 x = Directory.from_path(x)
-            dirs[x] = None
+            dirs.add(x)
 
         self._directories = dirs
 
@@ -400,7 +440,7 @@ class Config(Dependency):
             when you ask for the `Config.provider_chain`.
         """
         # make an ordered-set out of this.
-        self._providers = {x: None for x in xloop(value, default_not_iterate=[str])}
+        self._providers = OrderedSet.fromkeys(xloop(value, default_not_iterate=[str]))
 
     def add_provider(self, provider: Type[Provider]):
         """ Adds a provider type to end of my provider type list [you can see what it is for
@@ -414,8 +454,8 @@ class Config(Dependency):
         if provider in self._providers:
             return
 
-        # Add Provider type; using dict as an 'ordered set'; see xsentinels.OrderedSet.
-        self._providers[provider] = None
+        # Add Provider type; see `xcon.types.OrderedSet`.
+        self._providers.add(provider)
 
     def add_directory(self, directory: Union[Directory, str, DefaultType]) -> 'Config':
         """ Adds a directory to end of my directory list [you can see what it is for
@@ -430,8 +470,8 @@ class Config(Dependency):
         if directory in self._directories:
             return self
 
-        # Add Directory; using dict as an 'ordered set'; see xsentinels.OrderedSet
-        self._directories[directory] = None
+        # Add Directory; see `xcon.types.OrderedSet`.
+        self._directories.add(directory)
         return self
 
     def add_export(self, *, service: str):
@@ -469,7 +509,7 @@ class Config(Dependency):
                 you could use whatever you want).
         """
         # This is an OrderedDefaultSet, add in the service...
-        self._exports[service] = None
+        self._exports.add(service)
 
     def set_exports(self, *, services: Iterable[Union[str, DefaultType]]):
         """
@@ -492,7 +532,7 @@ class Config(Dependency):
                 to add by service name. If you don't add the `xsentinels.Default` somewhere in
                 this list then we will NOT check the parent-chain
         """
-        self._exports = {x: None for x in xloop(services, default_not_iterate=[str])}
+        self._exports = OrderedSet.fromkeys(xloop(services, default_not_iterate=[str]))
 
     def get_exports_by_service(self):
         """ List of services we currently check their export's for. This only lists the exports
@@ -954,13 +994,27 @@ class Config(Dependency):
         #       again and again as we pass the already lower-cased name along to other methods].
         name = name.lower()
 
-        # Otherwise, we follow standard process.
-        return self._get_item(
-            name=name,
-            skip_providers=skip_providers,
-            cursor=self._parent_chain().start_cursor(),
-            skip_source_logging=skip_logging
-        )
+        # If we are being called while another value is being resolved on this thread,
+        # keep using the settings snapshot that the outer call took.
+        if getattr(_resolve_local, 'settings', None) is not None:
+            return self._get_item(
+                name=name,
+                skip_providers=skip_providers,
+                cursor=self._parent_chain().start_cursor(),
+                skip_source_logging=skip_logging
+            )
+
+        _resolve_local.settings = _SettingsSnapshot()
+        try:
+            # Otherwise, we follow standard process.
+            return self._get_item(
+                name=name,
+                skip_providers=skip_providers,
+                cursor=self._parent_chain().start_cursor(),
+                skip_source_logging=skip_logging
+            )
+        finally:
+            _resolve_local.settings = None
 
     def _providers_with_cursor(self, cursor: Optional[_ParentCursor]) -> List[Provider]:
         pass
@@ -968,16 +1022,16 @@ class Config(Dependency):
     def _resolve_providers_with_cursor(
             self, cursor: Optional[_ParentCursor]
     ) -> OrderedSet[Type[Provider]]:
-        if _env_only_is_turned_on():
-            # We also disable cacher, see other place we call the `_env_only_is_turned_on` method.
-            return {EnvironmentalProvider: None}
+        if _resolve_settings().only_env_provider:
+            # We also disable cacher, see `Config._cacher_with_cursor`.
+            return OrderedSet.fromkeys((EnvironmentalProvider,))
 
         return self._resolve_attr_values_with_cursor(
             cursor=cursor,
             attribute_name="_providers",
             # Default to xcon_settings.providers if there are any,
             # otherwise just the EnvironmentalProvider:
-            defaults_factory=lambda: xcon_settings.providers or [EnvironmentalProvider]
+            defaults_factory=lambda: _resolve_settings().providers or (EnvironmentalProvider,)
         )
 
     def _resolve_directories_with_cursor(
@@ -1014,12 +1068,13 @@ class Config(Dependency):
 
         if exported:
             # Any new values will be added to end, nothing will happen to order of existing ones.
-            for x in exported:
-                directories[Directory(service=x, env=environment, is_export=True)] = None
+            directories.update(
+                Directory(service=x, env=environment, is_export=True) for x in exported
+            )
 
-        directories = {
-            k.resolve(service=service, environment=environment): None for k in directories
-        }
+        directories = OrderedSet.fromkeys(
+            k.resolve(service=service, environment=environment) for k in directories
+        )
 
         return directories
 
@@ -1049,7 +1104,7 @@ class Config(Dependency):
                 defaults_factory=defaults_factory
             )
         else:
-            parent_values = {x: None for x in defaults_factory()}
+            parent_values = OrderedSet.fromkeys(defaults_factory())
 
         # We have a default we need to 'insert' our parent providers into....
         # First we check to see if we only have 'Default'...
@@ -1060,12 +1115,12 @@ class Config(Dependency):
             return parent_values
 
         # If we have more then just 'Default', we replace it with parent providers...
-        final_values: OrderedSet[T] = {}
+        final_values: OrderedSet[T] = OrderedSet()
         for p in values:
             if p is default:
                 final_values.update(parent_values)
             else:
-                final_values[p] = None
+                final_values.add(p)
 
         return final_values
 
@@ -1077,16 +1132,10 @@ class Config(Dependency):
         Otherwise we need to create a provider_chain and cache/return that now and in the future.
         """
 
-        # Note from Josh: Keep things simple for now, just create provider chain when needed.
-        #
-        # if we find creating/finding the provider chain takes to long, then we can cache
-        # the chains by provider values. We could also keep them around and reset them if
-        # any of our parent's providers are changed, etc. I decided that it's probably not
-        # expensive and so not to pre-optimize and just worry about it down the road if that's
-        # not the case anymore.
-
+        # We resolve the providers each time [they could have changed], but reuse the
+        # provider chain we already have for the same resolved provider objects.
         provider_types = self._resolve_providers_with_cursor(cursor=cursor)
-        return ProviderChain(providers=provider_types)
+        return ProviderChain.interned(providers=provider_types)
 
     def _cacher_with_cursor(
             self,
@@ -1098,7 +1147,7 @@ class Config(Dependency):
             return None
 
         # if user wants to force only the environmental provider to be used, disable cacher too.
-        if _env_only_is_turned_on():
+        if _resolve_settings().only_env_provider:
             return None
 
         # If we have a parent, and user wants the Default cacher, ask the parent for it.
@@ -1127,7 +1176,7 @@ class Config(Dependency):
             # up (it looks it up in a case-insensitive manner).
             # Trying to make it a tiny bit more efficient since this is called a lot.
             env_provider = EnvironmentalProvider.grab()
-            if xcon_settings.disable_default_cacher:
+            if _resolve_settings().disable_default_cacher:
                 return None
             cacher = DynamoCacher
 
@@ -1264,7 +1313,7 @@ class Config(Dependency):
         directory_chain: DirectoryChain = None,
         provider_chain: ProviderChain = None
     ):
-        env_only_enabled = _env_only_is_turned_on()
+        env_only_enabled = _resolve_settings().only_env_provider
 
         if item and not item.directory.is_non_existent:
             # FYI: What's nice about doing it this way are these string formatting placeholders
@@ -1370,6 +1419,9 @@ class Config(Dependency):
         if not use_parent and not found_self:
             return _BlankParentChain
 
+        if not chain:
+            return _BlankParentChain
+
         return _ParentChain(parents=tuple(chain))
 
     def _directory_chain_with_cursor(
@@ -1397,24 +1449,34 @@ class Config(Dependency):
         if environment is Default:
             environment = self._environment_with_cursor(cursor)
 
-        return {
-            d.resolve(service=service, environment=environment): None
-            for d in xloop(xcon_settings.directories, default_not_iterate=[str])
-        }
+        return OrderedSet.fromkeys(
+            d.resolve(service=service, environment=environment)
+            for d in xloop(_resolve_settings().directories, default_not_iterate=[str])
+        )
+
+    # The service/environment are looked up for every value that goes to the providers,
+    # so instead of going though the general `_resolve_attr_with_cursor` (recursion + a
+    # defaults-factory lambda per call), we walk the parent-chain directly for these two.
 
     def _service_with_cursor(self, cursor: Optional[_ParentCursor]) -> str:
-        return self._resolve_attr_with_cursor(
-            cursor=cursor,
-            attribute_name='_service',
-            defaults_factory=lambda: xcon_settings.service or 'global'
-        )
+        service = self._service
+        while service is Default and cursor:
+            service = cursor.parent._service
+            cursor = cursor.next_cursor()
+
+        if service is Default:
+            return _resolve_settings().service or 'global'
+        return service
 
     def _environment_with_cursor(self, cursor: Optional[_ParentCursor]) -> str:
-        return self._resolve_attr_with_cursor(
-            cursor=cursor,
-            attribute_name='_environment',
-            defaults_factory=lambda: xcon_settings.environment or 'all'
-        )
+        environment = self._environment
+        while environment is Default and cursor:
+            environment = cursor.parent._environment
+            cursor = cursor.next_cursor()
+
+        if environment is Default:
+            return _resolve_settings().environment or 'all'
+        return environment
 
     def _get_special_non_provider_item_with_cursor(
             self,
@@ -1504,81 +1566,6 @@ Example use case:
 Config.grab()
 
 
-def _env_only_is_turned_on() -> bool:
-    # Check xcon_settings to see if env-only is  turned on.
-    return xcon_settings.only_env_provider
-
-
-# todo: remove this function, unused now.
-# todo: Remove and move doc comment
-def _replace_standard_directories(*, service: str, env: str) -> OrderedSet[Directory]:
-    """
-    Gives you the standard list of directories for service/env combination.
-    This is called when creating a `Config.__init__` if no `directories` are passed into any
-    Config object in the [Parent Chain](#parent-chain).
-
-    Normally you would want to use Config.directories = [Default]; which would cause the
-    Config object to ask it's parent chain, and they are also all set to `Default` then
-    it will call this `standard_directories` method for you to get the `Default` directories.
-
-    If for some reason you want to custimize or use diffrent service/env names for addtional
-    directory paths to check beyond the defaults, you can call this method and append them to
-    a config object, like so:
-
-    >>> from xcon.config import config
-    >>> for directory in standard_directories(service="customService", env="customEnv"):
-    ...     config.add_directory(directory)
-
-    The code ^ above would keep the default directory as the first one(s) to look at to the
-    current/default config. After looking at the pre-existing default ones it would next look
-    at your customService/customEnv paths too afterwards. Finally, Config would then look at
-    any ones added via `Config.add_export`.
-
-    ## Whats Returned Summary
-
-    For more details and context surounding what is returned, see
-    [Standard Directory Paths](#standard-directory-paths). Below is a summary.
-
-    As a side-note: you can change the default directories via
-    `xcon.conf.XconSettings.directories`,
-    so if that changes then what this returns will also change.
-
-    Right now we return these directories by default, in priority order:
-
-    1. `/{service}/{env}`
-    2. `/{service}/all`
-    3. `/global/{env}`
-    4. `/global/all`
-
-    If service == 'global' or None or blank, we will use `global` and only provide the two
-    global directories and leave the {service} ones out of it:
-
-    1. `/global/{env}`
-    2. `/global/all`
-
-    If there is no `env` avaliable, `env` will just only use `../all`
-
-    Parameters
-    -----------
-    service: str
-        The name of the service, generally the project's name, in camelCase.
-        You can grab the current service being used via `Config.SERVICE_NAME`.
-
-        If None/Blank, we will use `global`.
-
-    env: str
-        Environment, could be 'testing', 'prod', or something custom like 'yourName',
-        this is also generally in `camelCase`.
-
-        You can grab the current environment being used via `Config.resolved_environment`.
-
-        If None/Blank, we will use `all`.
-    """
-    # todo: remove this method eventually; for now keeping it so I can
-    #   leave it's doc-comment in-tact. I may want to use the doc-comment somewhere else.
-    raise NotImplemented("Deprecated/Unused")
-
-
 _BlankParentChain = _ParentChain()
 
 
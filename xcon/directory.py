@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import operator
 import string
-import weakref
-from dataclasses import dataclass, field
+import time
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError
+from sys import intern
 from types import MappingProxyType
-from typing import Union, Dict, Iterable, Mapping, Optional, Tuple
+from typing import Union, Dict, Iterable, Mapping, Optional, Tuple, Callable
 
 __pdoc__ = {
     "Directory.path": True,
@@ -17,45 +21,151 @@ import ciso8601
 
 from xsentinels import Default
 from .types import JsonDict
-from xloop import xloop
 
 from xcon.exceptions import ConfigError
 
 
-@dataclass(eq=True, frozen=True)
-class DirectoryChain:
+_object_setattr = object.__setattr__
+
+_get_path = operator.attrgetter('path')
+
+
+class _FrozenSlots:
+    """ Base for the immutable `__slots__` classes in this module.
+
+        Subclasses set their attributes once in `__init__` via `_object_setattr`;
+        after that setting/deleting an attribute raises a `dataclasses.FrozenInstanceError`,
+        just like the frozen dataclasses these classes used to be.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __getstate__(self):
+        # Used by copy/pickle; we have no `__dict__` so we gather up our slots.
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            _object_setattr(self, name, value)
+
+
+def _make_slot_assigner(cls: type) -> Callable[..., None]:
+    """ Generates a function that sets every slot of `cls` on an object,
+        ie: `assign(self, *, path, service, ...)`.
+
+        It stores each value via the slot's own descriptor (bound ahead of time), which is
+        noticeably faster than `object.__setattr__` (that has to look up the attribute on the
+        class each time); used by `__init__` of the classes in this module that are created
+        a lot [similar to what attrs does for it's slotted classes].
+    """
+    names = cls.__slots__
+    namespace = {f'_set_{n}': getattr(cls, n).__set__ for n in names}
+    lines = [f"def assign(self, *, {', '.join(names)}):"]
+    lines.extend(f"    _set_{n}(self, {n})" for n in names)
+    exec('\n'.join(lines), namespace)
+    return namespace['assign']
+
+
+class DirectoryChain(_FrozenSlots):
     """ Immutable list of directories, use to provide a hashing ability for list of directories.
     """
-    directories: Iterable[Directory] = field(default_factory=tuple, compare=False)
-    concatenated_directory_paths: str = field(init=False, compare=True)
+    __slots__ = ('directories', 'concatenated_directory_paths', '_paths', '_hash')
+
+    directories: Tuple[Directory, ...]
+    concatenated_directory_paths: str
 
-    def __post_init__(self):
+    def __init__(self, directories: Iterable[DirectoryOrPath] = ()):
         # ensure what we get passed in are converted to a tuple of Directory's
         # [in case there are strings, etc]. Ensures we don't have a mutable type
         # in our object [like a list or OrderedSet/dict].
-        directories = tuple(Directory.from_path(x) for x in self.directories)
-        object.__setattr__(self, 'directories', directories)
+        # (`map` avoids the generator frame a generator-expression would need).
+        directories = tuple(map(Directory.from_path, directories))
+        _object_setattr(self, 'directories', directories)
 
         # Pre-calculate a useful field, a concatenated list of the directory paths.
-        directory_key_names = []
-        for directory in directories:
-            directory_key_names.append(directory.path)
-        object.__setattr__(self, 'concatenated_directory_paths', '|'.join(directory_key_names))
+        # The same chains get created over and over, so we reuse the string when we can.
+        paths = tuple(map(_get_path, directories))
+        _object_setattr(self, '_paths', paths)
+        concatenated = _concatenated_paths(paths)
+        _object_setattr(self, 'concatenated_directory_paths', concatenated)
+        _object_setattr(self, '_hash', hash(concatenated))
+
+    # The directory paths uniquely identify the chain, they are what is used for eq/hash.
+    # Comparing the tuple of [interned] paths is cheaper than comparing the concatenated string.
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._paths == other._paths
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(directories={self.directories!r}, "
+            f"concatenated_directory_paths={self.concatenated_directory_paths!r})"
+        )
+
 
+_CHAIN_CONCAT_CACHE_MAX_SIZE = 1024
 
-# Setting frozen/immutable + eq, will also make us hashable with the
-# class-attr values automatically!
-@dataclass(eq=True, frozen=True)
-class Directory:
+_chain_concat_cache: OrderedDict[Tuple[str, ...], str] = OrderedDict()
+""" Tuple of directory paths -> `DirectoryChain.concatenated_directory_paths`,
+    least-recently used first.
+"""
+
+
+def _concatenated_paths(paths: Tuple[str, ...]) -> str:
+    cache = _chain_concat_cache
+    concatenated = cache.get(paths)
+    if concatenated is not None:
+        try:
+            cache.move_to_end(paths)
+        except KeyError:
+            # Another thread evicted it in the mean-time, no harm done.
+            pass
+        return concatenated
+
+    concatenated = cache[paths] = '|'.join(paths)
+    if len(cache) > _CHAIN_CONCAT_CACHE_MAX_SIZE:
+        try:
+            cache.popitem(last=False)
+        except KeyError:
+            # Another thread got to it first.
+            pass
+    return concatenated
+
+
+class Directory(_FrozenSlots):
     """
     Represents a path/directory to search in our various configuration service providers.
     If no 'service' is provided to the '__init__', then we default to the 'global' service.
     If no 'env' is provided, we won't include it in the directory/path.
+
+    Directories are immutable, compared via their `Directory.path` + `Directory.is_path_format`
+    and hashed via their `Directory.path`.
     """
 
-    # Both Prepopulated in __post_init__(...):
-    #   We also use this for compare since it's a single obj and uniquely identifies the directory.
-    path: str = field(init=True, default=None, compare=True)
+    # Directory objects are created a lot, so we use slots + a hand-written `__init__`
+    # that sets each attribute only once (vs a frozen dataclass which sets them in it's
+    # generated `__init__` and then again in `__post_init__`).
+    __slots__ = (
+        'path', 'service', 'env', 'is_non_existent', 'is_export', 'is_path_format',
+        '_resolve_cache', '_resolve_segments', '_hash',
+    )
+
+    path: str
     """ Directory path, this is the fundamental identity for a directory, and is what is used
         to compare it's self to other directories.
 
@@ -72,31 +182,31 @@ class Directory:
         **Exception Raised**
     """
 
-    service: str = field(compare=False, default=Default)
+    service: str
     """ Service part of the directory path. By Default, if no service or path is passed in
         this is set to `global`.
     """
 
-    env: Optional[str] = field(compare=False, default=None)
+    env: Optional[str]
     """ Environmental part of the directory path, ie: `/some_service/{env}`. If this is None
         (the default) we don't have the environment name in the resulting directory path.
     """
 
-    is_non_existent: bool = field(init=False, default=False, compare=False)
+    is_non_existent: bool
     """ If this directory is the special non-existent directory we use to for non-existent values,
         this will be True.
     """
 
-    is_export: bool = field(init=True, default=False, compare=False)
+    is_export: bool
     """ If this directory is for export values from another service, this is True.
         Example Path:
 
         /hubspot/export/testing/HUBSPOT_SOME_QUEUE_NAME
     """
 
-    # Setting `hash` to False, because it's very, very unlikely a formatted and unformatted
+    # Not used for the hash, because it's very, very unlikely a formatted and unformatted
     # Directory object would ever be in the same set/ordered-set/dict (ie: optimization).
-    is_path_format: bool = field(init=True, default=None, compare=True, hash=False)
+    is_path_format: bool
     """
     If `None` (default): WIll auto-discover if the path is formatted or not and set
     `is_path_format` to True or False depending on what is discovered
@@ -122,53 +232,101 @@ class Directory:
     will use the path `as-is`.
     """
 
-    def __post_init__(self):
-        if self.path:
-            assert not self.env, "Can't provide a env + path simultaneously to Directory."
-            assert not self.service, "Can't provide a service + path simultaneously to Directory."
-            service, env = _service_env_from_path(path=self.path)
-            object.__setattr__(self, "service", service)
-            object.__setattr__(self, "env", env)
+    _resolve_cache: Optional[Dict[Tuple[str, str], Directory]]
+    """
+    Used to cache `resolved` directory results based onfinal formatted service/environment values,
+    keyed by `(service, environment)`.
+    """
 
-        if not self.service:
+    _resolve_segments: Optional[Tuple[Tuple[str, Optional[str]], ...]]
+    """ For format paths, the path split into `(literal, format_key)` pairs; used by `resolve`
+        to build the formatted path without going though `str.format_map` each time.
+        None if not a format path, or if the path uses format-specs/conversions.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            service: str = Default,
+            env: Optional[str] = None,
+            is_export: bool = False,
+            is_path_format: Optional[bool] = None,
+    ):
+        if path:
+            assert not env, "Can't provide a env + path simultaneously to Directory."
+            assert not service, "Can't provide a service + path simultaneously to Directory."
+            service, env = _service_env_from_path(path=path)
+
+        if not service:
             # Default service to "global"
-            object.__setattr__(self, "service", "global")
+            service = "global"
 
         # Calculate the path one time, set it on path-var.
-        path = Directory._path_from_components(
-            service=self.service,
-            environment=self.env,
-            is_export=self.is_export
-        )
-        object.__setattr__(self, 'path', path)
+        path = intern(Directory._path_from_components(
+            service=service,
+            environment=env,
+            is_export=is_export
+        ))
 
-        if path == "/_nonExistent":
-            object.__setattr__(self, "is_non_existent", True)
-
-        if not self.is_export:
-            env = self.env
+        if not is_export:
             # If we have export in the start of environment name, we override is_export to True.
             if env and (env.startswith("export") or env.startswith("/export")):
-                object.__setattr__(self, "is_export", True)
+                is_export = True
 
-        is_path_format = self.is_path_format
         if is_path_format is None or is_path_format:
-            format_keys = {t[1] for t in string.Formatter().parse(path) if t[1] is not None}
-            unknown_keys = format_keys - {'service', 'environment'}
-            if unknown_keys:
-                raise ConfigError(
-                    f"Using unknown format keys ({unknown_keys}) for directory path ({path})."
-                )
-
-            object.__setattr__(self, "is_path_format", bool(format_keys))
-
-        # init the resolve-cache with dict if we are a format-path:
-        object.__setattr__(self, "_resolve_cache", dict() if self.is_path_format else None)
+            # Most paths have no formatting directives at all, no need to parse those.
+            format_keys = _path_format_keys(path) if '{' in path else None
+            if format_keys:
+                unknown_keys = format_keys - {'service', 'environment'}
+                if unknown_keys:
+                    raise ConfigError(
+                        f"Using unknown format keys ({set(unknown_keys)}) for directory "
+                        f"path ({path})."
+                    )
+
+            is_path_format = bool(format_keys)
+
+        _assign_directory_slots(
+            self,
+            path=path,
+            service=service,
+            env=env,
+            is_non_existent=path == "/_nonExistent",
+            is_export=is_export,
+            is_path_format=is_path_format,
+            # init the resolve-cache with dict if we are a format-path:
+            _resolve_cache=dict() if is_path_format else None,
+            _resolve_segments=_path_format_segments(path) if is_path_format else None,
+            _hash=hash(path),
+        )
 
         # Only cache it if it's not already present, we want to try to use a standard
         # Directory object for a particular path as much as possible.
+        # This is the only place directories are put into the cache.
         if path not in _path_to_directory_cache:
-            _path_to_directory_cache[path] = self
+            _cache_directory(self)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.path == other.path and self.is_path_format == other.is_path_format
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__qualname__}(path={self.path!r}, service={self.service!r}, "
+            f"env={self.env!r}, is_non_existent={self.is_non_existent!r}, "
+            f"is_export={self.is_export!r}, is_path_format={self.is_path_format!r})"
+        )
+
+    @classmethod
+    def clear_cache(cls):
+        """ Forgets the standard/interned `Directory` objects `Directory.from_path` hands out;
+            mostly useful for unit tests.
+        """
+        _path_to_directory_cache.clear()
 
     @classmethod
     def from_non_existent(cls) -> Directory:
@@ -182,26 +340,7 @@ class Directory:
 
     @classmethod
     def _path_from_components(cls, service: str, environment: str, is_export: bool = False):
-        if not service:
-            service = 'global'
-
-        path = f'/{service}'
-
-        if environment and environment.startswith("/"):
-            # Remove starting slash if needed
-            environment = environment[1:]
-
-        # Add 'export' to front if needed.
-        if is_export:
-            if not environment:
-                environment = "export"
-            elif not environment.startswith("export/"):
-                environment = f"export/{str(environment)}"
-
-        if environment:
-            path = f"{path}/{str(environment)}"
-
-        return path
+        return _path_from_components(service, environment, is_export)
 
     @classmethod
     def from_components(cls, service: str, environment: str):
@@ -218,21 +357,20 @@ class Directory:
             If path is None:
                 return None
         """
+        # We are most often given a Directory (ie: from the providers, for every name they are
+        # asked about), so check for that first; there is nothing to do for it.
+        # (`Directory.__init__` makes each new directory the standard one for its path,
+        # so they are normally already the standard one anyway).
+        if isinstance(path, Directory):
+            return path
+
         if path is None:
             # Python 3.9 will have the ability to say:
             #    "only if we get passed None, we will return None"
             #    for now, we type ourselves as non-optional return, since it's mostly true.
             return None
 
-        if isinstance(path, Directory):
-            # Try to intern the value to a standard-version [just a bit more efficient].
-            directory = _path_to_directory_cache.get(path.path, path)
-            if path is not directory:
-                # If we don't have this Directory object in cache, put it in there.
-                _path_to_directory_cache[directory.path] = directory
-            return directory
-
-        existing_dir = _path_to_directory_cache.get(path)
+        existing_dir = _cached_directory(path)
         if existing_dir:
             return existing_dir
 
@@ -240,30 +378,107 @@ class Directory:
         components = _service_env_from_path(path=path)
         return Directory(service=components[0], env=components[1])
 
-    _resolve_cache = None
-    """
-    Used to cache `resolved` directory results based onfinal formatted service/environment values.
-    """
-
     def resolve(self, service: str, environment: str) -> Directory:
         if not self.is_path_format:
             return self
 
-        if resolved_environs := self._resolve_cache.get(service):
-            if resolved := resolved_environs.get(environment):
-                return resolved
+        key = (service, environment)
+        if resolved := self._resolve_cache.get(key):
+            return resolved
 
         unformatted = self.path
-        formatted = unformatted.format_map({'service': service, 'environment': environment})
+        if segments := self._resolve_segments:
+            formatted = ''.join([
+                literal if name is None else (service if name == 'service' else environment)
+                for literal, name in segments
+            ])
+        else:
+            formatted = unformatted.format_map({'service': service, 'environment': environment})
         if formatted == unformatted:
-            self._resolve_cache.setdefault(service, {})[environment] = self
+            self._resolve_cache[key] = self
             return self
 
         resolved = Directory(path=formatted, is_path_format=False)
-        self._resolve_cache.setdefault(service, {})[environment] = resolved
+        self._resolve_cache[key] = resolved
         return resolved
 
 
+@functools.lru_cache(maxsize=1024)
+def _path_from_components(service: str, environment: Optional[str], is_export: bool) -> str:
+    """ See `Directory._path_from_components`; there are only a few distinct
+        service/environment combinations, so we remember the paths.
+    """
+    if not service:
+        service = 'global'
+
+    if environment and environment[0] == "/":
+        # Remove starting slash if needed
+        environment = environment[1:]
+
+    # Add 'export' to front if needed.
+    if is_export:
+        if not environment:
+            return f'/{service}/export'
+        if not environment.startswith("export/"):
+            return f'/{service}/export/{environment}'
+
+    if environment:
+        return f'/{service}/{environment}'
+    return f'/{service}'
+
+
+_formatter = string.Formatter()
+
+_format_path_cache: Dict[str, Tuple[frozenset, Optional[tuple]]] = {}
+""" Path -> (format keys, resolve segments), see `_parse_format_path`. """
+
+
+def _parse_format_path(path: str) -> Tuple[frozenset, Optional[tuple]]:
+    """ Parses `path` for formatting directives, only the first time we see the path.
+
+        Returns:
+            Tuple: First element are the format keys used (ie: `{'service', 'environment'}`).
+                Second is the path split up into `(literal, format_key)` pairs
+                (see `Directory._resolve_segments`), or None if the path uses any
+                format-specs or conversions (we then fall back to `str.format_map`).
+    """
+    parsed = _format_path_cache.get(path)
+    if parsed is not None:
+        return parsed
+
+    keys = set()
+    segments = []
+    for literal, name, spec, conversion in _formatter.parse(path):
+        if literal:
+            segments.append((literal, None))
+        if name is not None:
+            keys.add(name)
+            segments.append(('', name))
+            if spec or conversion:
+                segments = None
+                break
+
+    if segments is None:
+        # Still need to look at all the keys.
+        keys = {t[1] for t in _formatter.parse(path) if t[1] is not None}
+
+    parsed = _format_path_cache[path] = (frozenset(keys), tuple(segments) if segments else None)
+    return parsed
+
+
+def _path_format_keys(path: str) -> frozenset:
+    """ Returns the format keys used in `path` (ie: `{'service', 'environment'}`). """
+    return _parse_format_path(path)[0]
+
+
+def _path_format_segments(path: str) -> Optional[tuple]:
+    """ Returns the `(literal, format_key)` pairs for `path`, see `_parse_format_path`. """
+    return _parse_format_path(path)[1]
+
+
+_assign_directory_slots = _make_slot_assigner(Directory)
+
+
 def _service_env_from_path(path: str) -> Tuple[Optional[str], Optional[str]]:
     """ Takes path and parses out the service and env.
         If the path does not contain some component, uses None.
@@ -275,14 +490,76 @@ def _service_env_from_path(path: str) -> Tuple[Optional[str], Optional[str]]:
     if existing_dir:
         return existing_dir.service, existing_dir.env
 
-    # elements[0] should be a blank string [it's the part before the first `/`].
-    elements = path.split("/")
-    elements_len = len(elements)
-    service = elements[1] if elements_len > 1 else None
-    env = "/".join(elements[2:]) if elements_len > 2 else None
+    # Anything before the first `/` is ignored [normally a blank string];
+    # service is between the first and second `/`, env is everything after the second `/`.
+    # Slicing by index so we don't allocate a list + substrings for every `/` via `split`.
+    first_slash = path.find("/")
+    if first_slash < 0:
+        return None, None
+
+    second_slash = path.find("/", first_slash + 1)
+    if second_slash < 0:
+        service = path[first_slash + 1:]
+        env = None
+    else:
+        service = path[first_slash + 1:second_slash]
+        env = path[second_slash + 1:]
+
+    # There are only a small number of distinct service/env names, and they are compared a lot.
+    if service is not None:
+        service = intern(service)
+    if env is not None:
+        env = intern(env)
     return service, env
 
 
+_UTC_NOW_TICK_SECONDS = 0.01
+
+_utc_now_cache: Tuple[float, Optional[dt.datetime]] = (float('-inf'), None)
+""" (monotonic time, utc datetime) of last time `_utc_now` got the real current time. """
+
+
+def _utc_now() -> dt.datetime:
+    """ Current utc time, used for `DirectoryItem.created_at` by default.
+
+        Items often get created in large batches (ie: from a cacher), so we reuse the same
+        datetime object for `_UTC_NOW_TICK_SECONDS` instead of getting/allocating a new one
+        for each item; `created_at` does not need to be any more precise than that.
+    """
+    global _utc_now_cache
+    tick = time.monotonic()
+    cached_tick, cached_now = _utc_now_cache
+    if tick - cached_tick < _UTC_NOW_TICK_SECONDS:
+        return cached_now
+
+    now = dt.datetime.now(dt.timezone.utc)
+    _utc_now_cache = (tick, now)
+    return now
+
+
+_NORM_NAME_CACHE_MAX_SIZE = 1024
+
+_norm_name_cache: Dict[str, str] = {}
+""" Name -> lower-cased/interned name, see `_norm_name`. """
+
+
+def _norm_name(name: str) -> str:
+    """ Returns the standard form of a config name (lower-case + interned),
+        which is what `DirectoryItem.name` and `DirectoryListing` use.
+
+        The same few names get looked up constantly, so we remember them instead of
+        allocating a new lower-cased string every time.
+    """
+    normalized = _norm_name_cache.get(name)
+    if normalized is None:
+        normalized = intern(name.lower())
+        if len(_norm_name_cache) >= _NORM_NAME_CACHE_MAX_SIZE:
+            # Very unusual to have this many names; just start over.
+            _norm_name_cache.clear()
+        _norm_name_cache[name] = normalized
+    return normalized
+
+
 DirectoryOrPath = Union[Directory, str]
 """
 Type used to indicate a `Directory` or a `str` object [can be either].
@@ -295,8 +572,7 @@ DirectoryItemValue = Union[JsonDict, list, str, int, None]
 """
 
 
-@dataclass(frozen=True, eq=False)
-class DirectoryItem:
+class DirectoryItem(_FrozenSlots):
     """
     An immutable directory item, which associates a name/value pair for a particular directory.
     There is an optional ttl, mostly used with the Dynamo provider, but may be used in the
@@ -337,14 +613,20 @@ class DirectoryItem:
 
         .. todo:: Document other args, for now see individual class variable docs below.
     """
-    # Must have some sort of 'value' on the class for pdoc3 to pick up vars.
+    # DirectoryItem's are created for every value we look up (and every value we get back
+    # from a cacher); so we use slots + a hand-written `__init__` that sets each attribute once.
+    __slots__ = (
+        'directory', 'name', 'value', 'original_name', 'source', 'ttl', 'cacheable',
+        'created_at', 'cache_range_key', 'cache_concat_directory_paths',
+        'cache_concat_provider_names', 'cache_hash_key', 'from_cacher', '_supplemental_info',
+    )
 
-    directory: Optional[Union[Directory, str]] = None
+    directory: Directory
     """ This will always return a non-None directory object. If you give it a str in __init__,
         converts it to a Directory object for you.
     """
 
-    name: str = None
+    name: str
     """ This will always return a non-None name string, in lower-case.
         Whatever string is passed into this while creating a DirectoryItem object,
         DirectoryItem will lower-case it.
@@ -353,27 +635,25 @@ class DirectoryItem:
         `DirectoryItem.original_name`.
     """
 
-    value: DirectoryItemValue = None
+    value: DirectoryItemValue
     """ Value  """
 
-    original_name: str = None
+    original_name: str
     """ The original name of the value, before case was changed.
         If this is not set to anything when `DirectoryItem` is created,
         it will be set to `self.name`, before DirectoryItem lower-cases `self.name`.
     """
 
-    source: str = None
+    source: str
 
-    ttl: Union[dt.datetime, int] = None
+    ttl: Optional[dt.datetime]
     """ If give me an `int`, I'll convert it to a datetime for you;
         reading this var will always give you a `None` or a `datetime`.
     """
 
-    cacheable: bool = True
+    cacheable: bool
 
-    created_at: Optional[dt.datetime] = field(
-        default_factory=lambda: dt.datetime.now(dt.timezone.utc)
-    )
+    created_at: Optional[dt.datetime]
     """ Set at object creation by default to current date/time, you can pass in your own if needed.
         This happens when the item comes from Dynamo [ie: we store creation date in dynamo].
         If the item in Dynamo has no creation date, this will be None; this indicates an unknown
@@ -381,7 +661,7 @@ class DirectoryItem:
     """
 
     # These are only used by the dynamo cache table.
-    cache_range_key: str = None
+    cache_range_key: str
     """ If set, this is used for 'name' in the dynamo table. The range key contents was changed
         for the cache table. I left it as 'name' so I could have it backwards compatible with
         older/existing config objects.
@@ -395,10 +675,10 @@ class DirectoryItem:
 
         At some point we may create a global-all-configCacheV2 table and have better names on it.
     """
-    cache_concat_directory_paths: str = None
-    cache_concat_provider_names: str = None
+    cache_concat_directory_paths: str
+    cache_concat_provider_names: str
 
-    cache_hash_key: str = None
+    cache_hash_key: str
     """ This is used for the `directory` in the Dynamo table. The hash-key contents were changed
         for the cache dynamo table. I left it as `directory` on the table so it can be backwards
         compatible with the older Config class.
@@ -409,59 +689,95 @@ class DirectoryItem:
         At some point we may create a global-all-configCacheV2 table and have better names on it.
     """
 
-    from_cacher: bool = False
+    from_cacher: bool
     """ If True, this item came from the dynamo cache table (or a cacher in general).
         If False (default): Came from original source.
     """
 
     @property
     def supplemental_metadata(self) -> JsonDict:
-        return self._supplemental_info  # noqa: This exists (see __post_init__)
+        info = self._supplemental_info
+        if info is None:
+            # Most items never get any metadata, so we only allocate a dict when needed.
+            info = {}
+            _object_setattr(self, '_supplemental_info', info)
+        return info
 
     def add_supplemental_metadata(self, name: str, value):
-        self._supplemental_info[name] = value   # noqa: This exists (see __post_init__)
+        self.supplemental_metadata[name] = value
 
     # todo:
     #  Now that we split the libraries, we should import and use `xyn-model.JsonModel`:
     #  Literally all of the code in json() and __init__() and __repr__ and get some extra features
     #  [like change tracking, etc].
-    def __post_init__(self):
-        directory = self.directory
+    def __init__(
+            self,
+            directory: Optional[DirectoryOrPath] = None,
+            name: str = None,
+            value: DirectoryItemValue = None,
+            original_name: str = None,
+            source: str = None,
+            ttl: Union[dt.datetime, int, None] = None,
+            cacheable: bool = True,
+            created_at: Optional[dt.datetime] = Default,
+            cache_range_key: str = None,
+            cache_concat_directory_paths: str = None,
+            cache_concat_provider_names: str = None,
+            cache_hash_key: str = None,
+            from_cacher: bool = False,
+    ):
         if directory is None:
-            object.__setattr__(self, 'directory', Directory.from_non_existent())
+            directory = Directory.from_non_existent()
         elif isinstance(directory, str):
-            object.__setattr__(self, 'directory', Directory.from_path(directory))
+            directory = Directory.from_path(directory)
 
-        if not self.original_name:
-            object.__setattr__(self, 'original_name', self.name)
+        if not original_name:
+            original_name = name
 
         # todo: May want to have a cached mapping of Names to standard-format [optimization].
-        object.__setattr__(self, 'name', self.name.lower())
+        name = _norm_name(name)
 
-        # Use class default values if possible.
-        ttl = self.ttl
-        if ttl is not None and isinstance(ttl, int):
+        if type(ttl) is int:
             ttl = dt.datetime.fromtimestamp(ttl, dt.timezone.utc)
-            object.__setattr__(self, 'ttl', ttl)
 
-        # ensure it's a bool
-        object.__setattr__(self, 'cacheable', bool(self.cacheable))
+        # ensure it's a bool [nearly always is already].
+        if type(cacheable) is not bool:
+            cacheable = bool(cacheable)
 
-        # This won't effect dataclasses eq/hash/etc, just some supplemental metadata.
-        # This should NEVER effect this objects core-identity.
-        object.__setattr__(self, '_supplemental_info', {})
+        if created_at is Default:
+            created_at = _utc_now()
 
         if (
-            not self.cache_range_key and
-            self.cache_concat_directory_paths and
-            self.cache_concat_provider_names
+            not cache_range_key and
+            cache_concat_directory_paths and
+            cache_concat_provider_names
         ):
             # Just need a consistent unique key for dynamo, I don't need to parse it later.
             cache_range_key = (
-                f"{self.name}|+|{self.cache_concat_directory_paths}|+|"
-                f"{self.cache_concat_provider_names}"
+                f"{name}|+|{cache_concat_directory_paths}|+|"
+                f"{cache_concat_provider_names}"
             )
-            object.__setattr__(self, 'cache_range_key', cache_range_key)
+
+        _assign_directory_item_slots(
+            self,
+            directory=directory,
+            name=name,
+            value=value,
+            original_name=original_name,
+            source=source,
+            ttl=ttl,
+            cacheable=cacheable,
+            created_at=created_at,
+            cache_range_key=cache_range_key,
+            cache_concat_directory_paths=cache_concat_directory_paths,
+            cache_concat_provider_names=cache_concat_provider_names,
+            cache_hash_key=cache_hash_key,
+            from_cacher=from_cacher,
+            # This won't effect eq/hash/etc, just some supplemental metadata.
+            # This should NEVER effect this objects core-identity.
+            # (a dict is allocated the first time `supplemental_metadata` is used).
+            _supplemental_info=None,
+        )
 
     def __str__(self):
         """
@@ -483,20 +799,13 @@ class DirectoryItem:
                         console, it will include the value.
         """
         # todo: Someday if I could use the sdk here.... I could eliminate most or all of this code.
-        desc = f"DirectoryItem(name='{self.name}', directory='{self.directory.path}'"
-
-        value = self.value
-        if include_value:
-            desc += f", value='{value}'"
-
-        if self.source:
-            desc += f", source='{self.source}'"
-
-        if self.ttl:
-            desc += f", ttl='{self.ttl}'"
-
-        desc += ')'
-        return desc
+        value_part = f", value='{self.value}'" if include_value else ''
+        source_part = f", source='{self.source}'" if self.source else ''
+        ttl_part = f", ttl='{self.ttl}'" if self.ttl else ''
+        return (
+            f"DirectoryItem(name='{self.name}', directory='{self.directory.path}'"
+            f"{value_part}{source_part}{ttl_part})"
+        )
 
     @classmethod
     def from_json(cls, json: JsonDict, append_source: str = '', from_cacher: bool = False):
@@ -510,6 +819,8 @@ class DirectoryItem:
                 (or a cacher in general).
                 If False (default): Came from original source.
         """
+        # The `Directory` and the parsed `created_at` are memoized (see `Directory.from_path` and
+        # `_parse_iso_datetime`); the item itself is mutable so we make a new one each time.
         # todo: Someday if I could use the sdk here.... I could eliminate most or all of this code.
         real_name = json.get('real_name')
         cache_range_key = None
@@ -520,7 +831,7 @@ class DirectoryItem:
         else:
             name = json['name']
 
-        # If `original_name` is None, then __post_init__ will use `self.name` for it for us.
+        # If `original_name` is None, then __init__ will use `self.name` for it for us.
         original_name = json.get('original_name')
         real_directory = json.get('real_directory')
         cache_hash_key = None
@@ -549,7 +860,7 @@ class DirectoryItem:
         cache_concat_provider_names = json.get('cache_concat_provider_names')
 
         created_at = json.get('created_at', None)
-        created_at = ciso8601.parse_datetime(created_at) if created_at else None
+        created_at = _parse_iso_datetime(created_at) if created_at else None
 
         return DirectoryItem(
             directory=directory,
@@ -609,6 +920,32 @@ class DirectoryItem:
         return response
 
 
+_ISO_PARSE_CACHE_MAX_SIZE = 4096
+
+_iso_parse_cache: OrderedDict[str, dt.datetime] = OrderedDict()
+""" ISO date/time string -> parsed datetime, see `_parse_iso_datetime`. """
+
+
+def _parse_iso_datetime(value: str) -> dt.datetime:
+    """ Parses an ISO date/time string via `ciso8601`; items written to the cacher in the same
+        batch share the same `created_at` string, so we remember the last few we parsed.
+    """
+    cache = _iso_parse_cache
+    parsed = cache.get(value)
+    if parsed is None:
+        parsed = cache[value] = ciso8601.parse_datetime(value)
+        if len(cache) > _ISO_PARSE_CACHE_MAX_SIZE:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                # Another thread got to it first.
+                pass
+    return parsed
+
+
+_assign_directory_item_slots = _make_slot_assigner(DirectoryItem)
+
+
 class DirectoryListing:
     directory: Directory = None
     """ Metadata: used by external parties to keep track of the directory this listing belongs to.
@@ -620,11 +957,37 @@ class DirectoryListing:
 
     _items: Dict[str, DirectoryItem]
 
-    def __init__(self, directory: Directory = None, items: Iterable[DirectoryItem] = None):
+    def __init__(
+            self,
+            directory: Directory = None,
+            items: Iterable[DirectoryItem] = None,
+            item_map: Dict[str, DirectoryItem] = None
+    ):
+        """
+        Args:
+            directory: See `DirectoryListing.directory`.
+            items: Items to put into the listing.
+            item_map: An already built `DirectoryItem.name` -> item dict to use as-is for
+                the listing's items (instead of building one from `items`);
+                the listing takes ownership of it.
+        """
         self.directory = directory
-        self._items = {}
-        for item in xloop(items, default_not_iterate=[str]):
-            self.add_item(item)
+        if item_map is not None:
+            self._items = item_map
+            if items is not None:
+                self.add_items(items)
+            return
+
+        self._items = item_map = {}
+        if items is None:
+            return
+
+        if isinstance(items, DirectoryItem):
+            item_map[items.name] = items
+            return
+
+        for item in items:
+            item_map[item.name] = item
 
     def get_any_item(self) -> Optional[DirectoryItem]:
         if not self._items:
@@ -635,6 +998,10 @@ class DirectoryListing:
     def add_item(self, item: DirectoryItem):
         self._items[item.name] = item
 
+    def add_items(self, items: Iterable[DirectoryItem]):
+        """ Same as calling `DirectoryListing.add_item` for each item, but in one go. """
+        self._items.update({item.name: item for item in items})
+
     def remove_item_with_name(self, name: str):
         """
         Remove item with name from my directory listing.
@@ -643,7 +1010,7 @@ class DirectoryListing:
             name str: Name of item to remove. If item does not exist, nothing happens.
 
         """
-        self._items.pop(name.lower(), None)
+        self._items.pop(_norm_name(name), None)
 
     def get_items_with_different_value(
         self, items: Iterable[DirectoryItem]
@@ -672,7 +1039,7 @@ class DirectoryListing:
 
     def get_item(self, name: str) -> Optional[DirectoryItem]:
         """ Gets a item in a case-insensitive way, returns None if item does not exist in self. """
-        return self._items.get(name.lower(), None)
+        return self._items.get(_norm_name(name), None)
 
     def item_mapping(self) -> Mapping[str, DirectoryItem]:
         """ Read-only mapping of the items name to the item [reminder: names are in lower-case].
@@ -680,5 +1047,41 @@ class DirectoryListing:
         return MappingProxyType(self._items)
 
 
-# noinspection PyTypeChecker
-_path_to_directory_cache: Dict[str, Directory] = weakref.WeakValueDictionary()
+_PATH_TO_DIRECTORY_CACHE_MAX_SIZE = 4096
+""" Max number of directories we keep interned in `_path_to_directory_cache`; this is far more
+    than the number of distinct paths normally in use.
+"""
+
+_path_to_directory_cache: OrderedDict[str, Directory] = OrderedDict()
+""" Standard `Directory` object for a path, least-recently used first.
+
+    We keep strong references so the standard objects stay around between config lookups
+    (a weak-value dict would let them be garbage collected the moment a lookup is done with
+    them); it's bounded via `_PATH_TO_DIRECTORY_CACHE_MAX_SIZE`.
+"""
+
+
+def _cached_directory(path: str) -> Optional[Directory]:
+    """ Returns the standard directory for `path` if we have one (marking it recently used). """
+    directory = _path_to_directory_cache.get(path)
+    if directory is not None:
+        try:
+            _path_to_directory_cache.move_to_end(path)
+        except KeyError:
+            # Another thread evicted it in the mean-time, no harm done.
+            pass
+    return directory
+
+
+def _cache_directory(directory: Directory):
+    """ Makes `directory` the standard directory for it's path, evicting the least-recently
+        used directory if we have too many.
+    """
+    cache = _path_to_directory_cache
+    cache[directory.path] = directory
+    if len(cache) > _PATH_TO_DIRECTORY_CACHE_MAX_SIZE:
+        try:
+            cache.popitem(last=False)
+        except KeyError:
+            # Another thread got to it first.
+            pass
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import dataclasses
+import logging
 import os
 import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import ChainMap
+from concurrent.futures import Future
 from inspect import isclass
-from typing import Iterable, Optional, Mapping, Set, Type, Any, Callable, Dict
-from typing import Union
+from typing import Iterable, Optional, Mapping, Set, Type, Any, Callable, Dict, Tuple, Sequence
+from typing import Union, List
 
 from botocore.exceptions import BotoCoreError
 from xinject import Dependency, XContext
@@ -90,6 +95,15 @@ class Provider(Dependency):
     _errored_directories: Set[Directory]
     """ Used to keep track of directories we are excluding. """
 
+    _provider_class_name = 'Provider'
+    """ Name of the provider's class, set per-subclass so `log_about_items` can use it
+        without looking it up each time it logs.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._provider_class_name = cls.__name__
+
     # ------------------------------------
     # --------- Abstract Methods ---------
 
@@ -150,17 +164,32 @@ class Provider(Dependency):
         self._errored_directories = set()
 
     def log_about_items(
-        self, *, items: Iterable[DirectoryItem], path: str, msg_prefix='Retrieved'
+        self,
+        *,
+        items: Union[Iterable[DirectoryItem], Callable[[], Iterable[DirectoryItem]]],
+        path: str,
+        msg_prefix='Retrieved'
     ):
+        """ Logs the names of `items` at INFO level.
+
+            `items` can also be a callable that returns them, it's only called if the message
+            will really be logged (for when getting the items is not free).
+        """
         # We could be called before application has configured it's logging;
         # ensure logging has been configured before we log out.
         # Other-wise log message may never get logged out
         # (Python defaults to Warning log level).
 
+        # Don't bother gathering up the details if nothing will be logged.
+        if not log.isEnabledFor(logging.INFO):
+            return
+
         # Use cache_range_key if it exists, otherwise use name.
         # cache_range_key has the name + other uniquely identifying information.
+        if callable(items):
+            items = items()
         names = [v.cache_range_key or v.name for v in items]
-        provider_class = self.__class__.__name__
+        provider_class = self._provider_class_name
         thread_name = threading.current_thread().name
 
         log.info(
@@ -178,7 +207,10 @@ class Provider(Dependency):
 
     def mark_errored_directory(self, directory: Directory):
         """ If a directory has an error, this is called. For informational purposes only. """
-        self._errored_directories.add(directory)
+        errored_directories = self._errored_directories
+        # Normally it's already in there (we keep asking for the same errored directory).
+        if directory not in errored_directories:
+            errored_directories.add(directory)
 
     def directory_has_error(self, directory: Directory):
         """ If a directory had an error in the past, this returns true.
@@ -206,7 +238,11 @@ class Provider(Dependency):
         return item.value if item else None
 
 
-class AwsProvider(Provider):
+class AwsProvider(
+    Provider,
+    # A copy of a provider is a different provider, it needs to get it's own local-cache.
+    attributes_to_skip_while_copying=['_local_cache_entry']
+):
     """ AwsProvider is the Base class for Aws-associated config providers.
 
         There is some aws specific error handing that this class helps with among the
@@ -220,10 +256,30 @@ class AwsProvider(Provider):
         probable due to a corrupted or missing aws credentials.
     """
 
+    _local_cache_entry: Optional[
+        Tuple[InternalLocalProviderCache, int, Dict[Directory, DirectoryListing]]
+    ] = None
+    """ (owner, owner's `InternalLocalProviderCache._cache_gen`, cache) from when we last got
+        our cache from an `InternalLocalProviderCache`, see `AwsProvider.local_cache`.
+
+        Kept together in one attribute (replaced all at once), so another thread using us with
+        a different `InternalLocalProviderCache` can't leave us with a mix of the two.
+    """
+
     @property
     def local_cache(self) -> Dict[Directory, DirectoryListing]:
         cacher = InternalLocalProviderCache.grab()
-        return cacher.get_cache_for_provider(provider=self, cache_constructor=lambda c: dict())
+        cacher.expire_cache_if_needed()
+        # Same cache object as last time, until it's reset/expired.
+        entry = self._local_cache_entry
+        if entry is not None and entry[0] is cacher and entry[1] == cacher._cache_gen:
+            return entry[2]
+
+        local_cache = cacher.get_cache_for_provider(
+            provider=self, cache_constructor=lambda c: dict()
+        )
+        self._local_cache_entry = (cacher, cacher._cache_gen, local_cache)
+        return local_cache
 
 
 class ProviderCacher(AwsProvider):
@@ -296,24 +352,44 @@ class ProviderChain:
         then this will set to `False`.
     """
 
+    _pre_cache_providers: tuple = dataclasses.field(
+        init=False, compare=False, repr=False, default=()
+    )
+    """ Providers that are consulted before the cacher (the leading providers that have
+        `Provider.query_before_cache_if_possible` set to True), see `_providers_with_cacher`.
+    """
+
+    _post_cache_providers: tuple = dataclasses.field(
+        init=False, compare=False, repr=False, default=()
+    )
+    """ The rest of the providers, consulted after the cacher. """
+
     def __post_init__(self):
-        providers = list()
-        context = XContext.grab()
-        provider_key_names = []
-        query_before_finished = False
-        for p in xloop(self.providers, default_not_iterate=[str]):
+        providers = self.providers
+        # Normally we are given a tuple of provider objects already (see `interned`),
+        # in which case there is nothing to flatten or resolve.
+        if type(providers) is not tuple or any(isclass(p) for p in providers):
+            context = XContext.grab()
             # Check to see if any of them are classes [and type's resources needs to be grabbed].
-            if isclass(p):
-                p = context.dependency(p)
-            providers.append(p)
+            providers = tuple(
+                context.dependency(p) if isclass(p) else p
+                for p in xloop(providers, default_not_iterate=[str])
+            )
 
+        provider_key_names = []
+        query_before_finished = False
+        pre_cache_count = 0
+        for p in providers:
             if not query_before_finished:
                 if p.query_before_cache_if_possible:
+                    pre_cache_count += 1
                     continue
                 query_before_finished = True
             provider_key_names.append(p.name)
 
-        object.__setattr__(self, 'providers', tuple(providers))
+        object.__setattr__(self, 'providers', providers)
+        object.__setattr__(self, '_pre_cache_providers', providers[:pre_cache_count])
+        object.__setattr__(self, '_post_cache_providers', providers[pre_cache_count:])
 
         if not query_before_finished:
             object.__setattr__(self, 'have_any_cachable_providers', False)
@@ -322,22 +398,40 @@ class ProviderChain:
         provider_names = '|'.join(provider_key_names)
         object.__setattr__(self, 'concatenated_provider_names', provider_names)
 
+    @classmethod
+    def interned(cls, providers: Iterable[Union[Provider, Type[Provider]]]) -> ProviderChain:
+        """ Returns a `ProviderChain` for `providers`, the same way creating one directly would,
+            except that we reuse a chain we already have for the same provider objects
+            (after resolving any provider types via the current context).
+
+            The chains are remembered in the current `InternalLocalProviderCache`, so they
+            (and the providers in them) are let go of when it's reset/expired; the same as the
+            providers own internal/local caches.
+        """
+        context = XContext.grab()
+        resolved = tuple(
+            context.dependency(p) if isclass(p) else p
+            for p in xloop(providers, default_not_iterate=[str])
+        )
+        intern = InternalLocalProviderCache.grab()._provider_chain_intern
+        chain = intern.get(resolved)
+        if chain is None:
+            # If another thread beat us to it, use theirs.
+            chain = intern.setdefault(resolved, cls(providers=resolved))
+        return chain
+
     def _providers_with_cacher(
             self,
             directory_chain: DirectoryChain,
             cacher: Optional[ProviderCacher] = None,
             environ: Directory = None
-    ) -> Iterable[Provider]:
-        """ Generator of providers and cacher, as needed. """
-        already_used_cache = False
-        for provider in self.providers:
-            if already_used_cache or provider.query_before_cache_if_possible:
-                yield provider
-                continue
-            already_used_cache = True
-            if cacher:
-                yield cacher
-            yield provider
+    ) -> Tuple[Provider, ...]:
+        """ Providers and cacher [if any] in the order they should be consulted. """
+        post_cache_providers = self._post_cache_providers
+        if not cacher or not post_cache_providers:
+            # Cacher only goes in front of the first cachable provider, if we have one.
+            return self.providers
+        return self._pre_cache_providers + (cacher,) + post_cache_providers
 
     def get_item(
         self,
@@ -354,46 +448,121 @@ class ProviderChain:
         our own providers via `DirectoryChain.providers`.
 
         If needed we will tell the cacher before we return to cache the values we find.
+
+        When there is no cacher to use, results are remembered in the current
+        `InternalLocalProviderCache` until it's expired/reset (the same as the providers
+        own internal/local caches). When we do use a cacher, we always go though the
+        providers/cacher, since where the cacher stores things can change from call to call
+        (see `xcon.providers.dynamo.DynamoCacher`) and it needs to be told what to cache.
+        """
+        # Our remembered results (below) expire along with the providers internal/local caches.
+        local_cache = InternalLocalProviderCache.grab()
+        local_cache.expire_cache_if_needed()
+
+        if cacher and environ and self.have_any_cachable_providers:
+            return self._get_item_with_cacher(
+                name=name, directory_chain=directory_chain, cacher=cacher, environ=environ
+            )
+
+        results = local_cache._chain_result_cache
+        key = (name, self.providers, directory_chain, environ)
+        item = results.get(key)
+        if item is not None:
+            return item
+
+        item = self._get_item_without_cacher(
+            name=name, directory_chain=directory_chain, environ=environ
+        )
+
+        # Non-cacheable items are specific to this process/instance (ie: environmental vars);
+        # we leave those alone so they are always looked up fresh.
+        if item.cacheable:
+            if len(results) >= _CHAIN_RESULT_CACHE_MAX_SIZE:
+                results.clear()
+            results[key] = item
+        return item
+
+    def _get_item_without_cacher(
+        self,
+        name: str,
+        directory_chain: DirectoryChain,
+        environ: Directory = None
+    ) -> DirectoryItem:
+        """ Does the real work for `ProviderChain.get_item` when there is no cacher to use;
+            we just go though our providers for each directory, in order.
         """
-        use_cacher = (cacher and environ)
-        items_cache = {}
         item = None
-        places_checked = []
+        places_checked = _PlacesChecked()
+        providers = self.providers
 
         for directory in directory_chain.directories:
-            item = None
-            for provider in self._providers_with_cacher(
-                directory_chain=directory_chain, cacher=cacher, environ=environ
-            ):
-                item = provider.get_item(
-                    name=name, directory=directory,
-                    directory_chain=directory_chain,
-                    provider_chain=self,
-                    environ=environ
-                )
+            item = self._query_providers(
+                providers,
+                name=name,
+                directory=directory,
+                directory_chain=directory_chain,
+                environ=environ,
+                places_checked=places_checked
+            )
+            if item:
+                break
 
-                had_error = provider.directory_has_error(directory)
-                if had_error:
-                    result = "error"
-                elif item and item.directory and item.directory.is_non_existent:
-                    result = "found(cached-as-non-existent)"
-                elif item:
-                    result = "found"
-                else:
-                    result = "not-found"
-
-                places_checked.append(
-                    f"{provider.name}:{directory.path} | result={result}"
-                )
+        # If we did not find the item, create a 'nonExistent' item in it's place.
+        # (a new one each time, since we attach this lookup's metadata to it).
+        if not item:
+            item = DirectoryItem(None, name, value=None, source="/_nonExistent")
 
-                if item is not None:
-                    break
+        item.add_supplemental_metadata("locations_searched", places_checked)
+        return item
+
+    def _get_item_with_cacher(
+        self,
+        name: str,
+        directory_chain: DirectoryChain,
+        cacher: ProviderCacher,
+        environ: Directory
+    ) -> DirectoryItem:
+        """ Does the real work for `ProviderChain.get_item` when we have a cacher to use;
+            it's consulted in-between our providers (see `_providers_with_cacher`) and told
+            about what we find at the end.
+        """
+        use_cacher = True
+        # Directories we looked in, highest priority first.
+        directories_checked = []
+        item = None
+        places_checked = _PlacesChecked()
+
+        providers = self._providers_with_cacher(
+            directory_chain=directory_chain, cacher=cacher, environ=environ
+        )
+
+        for directory in directory_chain.directories:
+            item = self._query_providers(
+                providers,
+                name=name,
+                directory=directory,
+                directory_chain=directory_chain,
+                environ=environ,
+                places_checked=places_checked
+            )
 
             if use_cacher and item and not item.cacheable:
                 # Optimization: Don't spend time looking at what cacher could send if our
                 # value is not cacheable [probably an environmental var].
                 use_cacher = False
 
+            directories_checked.append(directory)
+            if item:
+                break
+
+        # If we did not find the item, create a 'nonExistent' item in it's place.
+        # (a new one each time, since we attach this lookup's metadata to it).
+        if not item:
+            item = DirectoryItem(None, name, value=None, source="/_nonExistent")
+
+        item.add_supplemental_metadata("locations_searched", places_checked)
+
+        if use_cacher and item.cacheable:
             # Priority for items is given to directories order, keep what we've already got
             # over the new stuff from a lower-priority directory.
             #
@@ -410,22 +579,15 @@ class ProviderChain:
             #   looked up and writing it to cache [only things that have not been in cache
             #   previously]. But we would need a way to force-write the current batch when
             #   we are done [think about it].
-            if use_cacher:
-                items_cache = {
-                    **self.retrieved_items_map(directory=directory),
-                    **items_cache
-                }
-
-            if item:
-                break
-
-        # If we did not find the item, create a 'nonExistent' item in it's place.
-        if not item:
-            item = DirectoryItem(None, name, value=None, source=f"/_nonExistent")
-
-        item.add_supplemental_metadata("locations_searched", places_checked)
-
-        if use_cacher and item.cacheable:
+            #
+            # We only gather these up once we know we will be caching them;
+            # first one seen wins, `directories_checked` is in priority order.
+            items_cache = {}
+            setdefault = items_cache.setdefault
+            for directory in directories_checked:
+                for item_map in self._retrieved_provider_maps(directory):
+                    for item_name, map_item in item_map.items():
+                        setdefault(item_name, map_item)
             items_cache[item.name] = item
             cacher.cache_items(
                 items_cache.values(),
@@ -435,13 +597,49 @@ class ProviderChain:
             )
         return item
 
+    def _query_providers(
+        self,
+        providers: Iterable[Provider],
+        *,
+        name: str,
+        directory: Directory,
+        directory_chain: DirectoryChain,
+        environ: Optional[Directory],
+        places_checked: _PlacesChecked
+    ) -> Optional[DirectoryItem]:
+        """ Asks each provider in turn for `name` in `directory`, returning the first item
+            we get back. Appends what we did to `places_checked` as we go.
+        """
+        item = None
+        for provider in providers:
+            item = provider.get_item(
+                name=name, directory=directory,
+                directory_chain=directory_chain,
+                provider_chain=self,
+                environ=environ
+            )
+
+            if directory in provider._errored_directories:
+                state = 0
+            elif item is None:
+                state = 1
+            else:
+                item_directory = item.directory
+                state = 3 if item_directory and item_directory.is_non_existent else 2
+
+            places_checked.append((provider.name, directory.path, _PLACE_RESULTS[state]))
+
+            if item is not None:
+                break
+        return item
+
     def retrieved_items_map(
             self, directory: DirectoryOrPath
     ) -> Mapping[str, DirectoryItem]:
         """
         Will return a read-only lower-case item name TO item mapping by going through each
         provider in my chain, starting with the highest priority and calling
-        `retrieved_items_map()` on them and collecting the results into a single dict that I'll
+        `retrieved_items_map()` on them and collecting the results into a single mapping that I'll
         return.
 
         Keep in mind that if a provider has not retrieved anything yet, I'll stop and return
@@ -450,19 +648,76 @@ class ProviderChain:
         could end up with the wrong values.  Since I stop at the first provider that has not
         retrieved the passed in directory yet, we are protected from that possibility.
         """
-        final_map = {}
+        # Earlier [higher-priority] providers override later ones; a `ChainMap` gives us that
+        # view without copying each map into a new dict.
+        return ChainMap(*self._retrieved_provider_maps(directory))
+
+    def _retrieved_provider_maps(self, directory: DirectoryOrPath) -> List[Mapping]:
+        """ Each provider's `Provider.retrieved_items_map` for `directory`, highest priority
+            first; stopping at the first provider that has not retrieved it yet
+            (see `ProviderChain.retrieved_items_map`).
+        """
+        provider_maps = []
         for provider in self.providers:
             provider_map = provider.retrieved_items_map(directory)
             if provider_map is None:
                 # We stop when we encounter a provider that has not retrieved
                 # the directory listing yet [safety mechanism, see doc comment above].
                 break
-            # `final_map` is second, so it overrides the `provider_map` dict.
-            final_map = {**provider_map, **final_map}
-        return final_map
+            provider_maps.append(provider_map)
+        return provider_maps
+
+
+_PLACE_RESULTS = ("error", "not-found", "found", "found(cached-as-non-existent)")
+""" What `ProviderChain._query_providers` records in `_PlacesChecked` for each provider. """
 
 
-class InternalLocalProviderCache(Dependency):
+class _PlacesChecked(Sequence[str]):
+    """ The places `ProviderChain.get_item` looked for an item, put into the item's
+        `xcon.directory.DirectoryItem.supplemental_metadata` as `locations_searched`.
+
+        We record `(provider_name, directory_path, result)` tuples while looking, and only
+        format them into strings (ie: `"env:/global/all | result=not-found"`) when someone
+        actually looks at them (normally only when debug logging is on).
+    """
+    __slots__ = ('_places',)
+
+    def __init__(self):
+        self._places = []
+
+    def append(self, place: Tuple[str, str, str]):
+        self._places.append(place)
+
+    @staticmethod
+    def _format(place: Tuple[str, str, str]) -> str:
+        provider_name, path, result = place
+        return f"{provider_name}:{path} | result={result}"
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._format(p) for p in self._places[index]]
+        return self._format(self._places[index])
+
+    def __len__(self):
+        return len(self._places)
+
+    def __iter__(self):
+        return map(self._format, self._places)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    __str__ = __repr__
+
+
+_CHAIN_RESULT_CACHE_MAX_SIZE = 4096
+
+
+class InternalLocalProviderCache(
+    Dependency,
+    # A copy gets it's own in-flight constructions (see `__init__`).
+    attributes_to_skip_while_copying=['_in_flight']
+):
     """
     Used by the providers for a place to store/cache things they retrieve from the systems
     they provide configuration values from.
@@ -483,34 +738,64 @@ class InternalLocalProviderCache(Dependency):
     and simplifies the 'high-level' conceptual aspect of how the Config and its internal
     caching works from a usability/user-of-the-library point of view.
 
-    At the moment, the key is id/memory-address of the provider instance.
+    At the moment, the key is the provider instance itself (held weakly).
     This means a new provider instance would provide a new/blank cache for that object.
-    The old instance, if still used, would still have access to whatever it previously cached.
+    The old instance, if still used, would still have access to whatever it previously cached;
+    once it's garbage collected, its cache goes away with it.
     """
-    _local_internal_cache = None
+    _local_internal_cache: weakref.WeakKeyDictionary = None
     _time_cache_last_reset = None
 
-    expire_time_delta: dt.timedelta = dt.timedelta(minutes=15)
-    """
-    Amount of time before cache expires.
-    You can change this to anything you want at any time,
-    as it's checked each time a provider retrieves it's cache.
-    The providers do this every time they are asked for a value.
+    _chain_result_cache: Dict[tuple, DirectoryItem] = None
+    """ Results of `ProviderChain.get_item`, they expire along with everything else in here. """
 
-    In addition to changing this directly
-    (via `InternalLocalProviderCache.grab().expire_time_delta` = ...)
-    you can also override this via an environmental variable:
+    _provider_chain_intern: Dict[tuple, ProviderChain] = None
+    """ Tuple of provider objects -> `ProviderChain`, see `ProviderChain.interned`. """
 
-    `XCON_INTERNAL_CACHE_EXPIRATION_MINUTES`
+    _cache_gen: int = 0
+    """ Incremented each time the cache is reset/expired. """
 
-    If this variable is defined, we will take the value as the number of minutes
-    to wait until we expire/reset our cache.
+    _in_flight: Dict[Provider, Tuple[Future, int]]
+    """ Provider -> (future, thread ident) for caches that are being constructed right now,
+        see `get_cache_for_provider`.
+    """
 
-    Otherwise the default expiration is 15 minutes.
+    _expire_time_delta: dt.timedelta = dt.timedelta(minutes=15)
+    _reset_at_monotonic: float = 0.0
+    _expire_at_monotonic: float = 0.0
+    """ `time.monotonic()` value after which we expire/reset the cache; checking a float is
+        much cheaper than getting/comparing datetime's on every provider cache access.
     """
 
+    @property
+    def expire_time_delta(self) -> dt.timedelta:
+        """
+        Amount of time before cache expires.
+        You can change this to anything you want at any time,
+        as it's checked each time a provider retrieves it's cache.
+        The providers do this every time they are asked for a value.
+
+        In addition to changing this directly
+        (via `InternalLocalProviderCache.grab().expire_time_delta` = ...)
+        you can also override this via an environmental variable:
+
+        `XCON_INTERNAL_CACHE_EXPIRATION_MINUTES`
+
+        If this variable is defined, we will take the value as the number of minutes
+        to wait until we expire/reset our cache.
+
+        Otherwise the default expiration is 15 minutes.
+        """
+        return self._expire_time_delta
+
+    @expire_time_delta.setter
+    def expire_time_delta(self, value: dt.timedelta):
+        self._expire_time_delta = value
+        self._expire_at_monotonic = self._reset_at_monotonic + value.total_seconds()
+
     def __init__(self):
         super().__init__()
+        self._in_flight = {}
         from xcon import xcon_settings
         if minutes := xcon_settings.internal_cache_expiration_minutes:
             if minutes > 0:
@@ -522,6 +807,7 @@ class InternalLocalProviderCache(Dependency):
     ) -> Any:
         """
         Given `provider`, we will return a cached object keyed to the `provider` instance.
+        You can also pass in a provider type, for a cache shared by all of it's instances.
 
         If there currently is no cache object for `provider` instance in self,
         and you provide a `cache_constructor`, we will call the `cache_constructor` and provide
@@ -535,32 +821,74 @@ class InternalLocalProviderCache(Dependency):
         the instance of InternalLocalProviderCache we give the constructor callback.
 
         If we still don't have a value, and you provided a constructor, we will raise a ValueError.
+
+        Before looking, we expire/reset the cache if it's time to do so
+        (see `InternalLocalProviderCache.expire_cache_if_needed`).
+
+        If several threads need the same missing cache at the same time, only one of them calls
+        `cache_constructor`; the others wait for it and get the same object back.
         """
         self.expire_cache_if_needed()
-        provider_id = id(provider)
-        cache = self._local_internal_cache.get(provider_id)
-        if cache is None and cache_constructor:
-            cache = cache_constructor(self)
-            if cache is None:
-                cache = self._local_internal_cache.get(provider_id)
-
+        cache = self._local_internal_cache.get(provider)
+        if cache is not None or not cache_constructor:
+            return cache
+
+        # `setdefault` is atomic, so only one thread gets to put it's future in; no lock needed.
+        thread_ident = threading.get_ident()
+        claim = (Future(), thread_ident)
+        future, constructing_thread = self._in_flight.setdefault(provider, claim)
+        if constructing_thread != thread_ident:
+            return future.result()
+        if future is not claim[0]:
+            # It's us constructing it and the constructor needs it; don't wait on ourselves.
+            return self._construct_cache(provider=provider, cache_constructor=cache_constructor)
+
+        try:
+            # Another thread may have finished constructing it just before we claimed it.
+            cache = self._local_internal_cache.get(provider)
             if cache is None:
-                raise ValueError(
-                    f"Provided cache_constructor returned a None value and also did not set "
-                    f"a value either in InternalLocalProviderCache for provider ({provider})."
+                cache = self._construct_cache(
+                    provider=provider, cache_constructor=cache_constructor
                 )
-            self._local_internal_cache[provider_id] = cache
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(cache)
+        finally:
+            # Constructed caches are stored before this, so no one will miss them.
+            del self._in_flight[provider]
+        return cache
 
+    def _construct_cache(
+        self, *, provider: Provider, cache_constructor: Callable[[InternalLocalProviderCache], Any]
+    ) -> Any:
+        cache = cache_constructor(self)
+        if cache is None:
+            cache = self._local_internal_cache.get(provider)
+
+        if cache is None:
+            raise ValueError(
+                f"Provided cache_constructor returned a None value and also did not set "
+                f"a value either in InternalLocalProviderCache for provider ({provider})."
+            )
+        self._local_internal_cache[provider] = cache
         return cache
 
     def set_cache_for_provider(self, *, provider: Provider, cache: Any):
         self.expire_cache_if_needed()
-        self._local_internal_cache[id(provider)] = cache
+        self._local_internal_cache[provider] = cache
 
     def expire_cache_if_needed(self):
-        if self._time_cache_last_reset < dt.datetime.now() - self.expire_time_delta:
+        if time.monotonic() > self._expire_at_monotonic:
             self.reset_cache()
 
     def reset_cache(self):
-        self._local_internal_cache = {}
+        self._local_internal_cache = weakref.WeakKeyDictionary()
+        self._chain_result_cache = {}
+        self._provider_chain_intern = {}
+        self._cache_gen += 1
+        # Only kept around for informational purposes, we use the monotonic values for expiring.
         self._time_cache_last_reset = dt.datetime.now()
+        self._reset_at_monotonic = now = time.monotonic()
+        self._expire_at_monotonic = now + self._expire_time_delta.total_seconds()
@@ -6,24 +6,25 @@ from ..provider import AwsProvider
 
 log = logging.getLogger(__name__)
 
-aws_error_classes_to_ignore = {
+aws_error_classes_to_ignore = (
     # If no aws credentials were found.
     exceptions.NoCredentialsError,
     exceptions.NoRegionError,
-}
+)
+""" Tuple of botocore error classes to ignore, in a form `isinstance` can check directly. """
 
-aws_error_codes_to_ignore = {
+aws_error_codes_to_ignore = frozenset({
     # If app does not have permission to get a specific directory/path.
     'AccessDeniedException',
 
     # Not sure if I want to include these?
     'InvalidSignatureException',  # Probably aws access_key is wrong.
-    'UnrecognizedClientException'  # When security token is invalid [probably wrong aws key_id].
+    'UnrecognizedClientException',  # When security token is invalid [probably wrong aws key_id].
     'ExpiredTokenException',  # When temporary creds are expired (from sso creds)
 
     # Example: If dynamo cache table does not exist; we want to ignore it and just move on...
-    'ResourceNotFoundException'
-}
+    'ResourceNotFoundException',
+})
 """ List of error codes from boto to ignore. We log a warning, but continue on. """
 
 
@@ -38,16 +39,15 @@ def handle_aws_exception(exception: Exception, provider: AwsProvider, directory:
         This informs the provider so they don't keep asking for this directory in the future.
     """
     # First check to see if we have a specific `BotoCoreError` subclass of some sort...
-    for ignored_error_class in aws_error_classes_to_ignore:
-        if isinstance(exception, ignored_error_class):
-            e_type = type(exception)
-            log_ignored_aws_exception(
-                exception=exception,
-                provider=provider,
-                directory=directory,
-                error_detail=f"error class [{e_type.__module__}.{e_type.__name__}]"
-            )
-            return
+    if isinstance(exception, aws_error_classes_to_ignore):
+        e_type = type(exception)
+        log_ignored_aws_exception(
+            exception=exception,
+            provider=provider,
+            directory=directory,
+            error_detail=f"error class [{e_type.__module__}.{e_type.__name__}]"
+        )
+        return
 
     # Handle it if it's a client error...
     if not isinstance(exception, exceptions.ClientError):
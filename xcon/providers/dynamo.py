@@ -2,18 +2,25 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
+import functools
+import hashlib
+import json
 import logging
 import os
 import random
-from collections import defaultdict
-from typing import Dict, Optional, Callable, Iterable, Sequence, Tuple, Any
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Optional, Callable, Iterable, Sequence, Tuple, Any, List
 from typing import Mapping
 
-from boto3.dynamodb import conditions
-from xboto.dependencies import BotoResources
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config as BotocoreConfig
+from xboto.dependencies import BotoResources, BotoClient, boto_session
 from xinject import Dependency
 from xsentinels import Default
-from xloop import xloop
 from xsentinels.default import DefaultType
 
 from xcon.directory import Directory, DirectoryListing, DirectoryOrPath, DirectoryItem, \
@@ -56,22 +63,91 @@ class DynamoProvider(AwsProvider):
         if listing:
             return listing.get_item(name)
 
-        # We need to look up the directory listing from Dynamo.
+        # We need to look up the directory listing from Dynamo; we get any other directories
+        # in the chain we have not looked up yet at the same time (we will likely need them).
+        directories = [directory]
+        if directory_chain:
+            directories.extend(directory_chain.directories)
+        self.prefetch_directories(directories)
+        return self.local_cache[directory].get_item(name)
+
+    def prefetch_directories(self, directories: Iterable[DirectoryOrPath]):
+        """ Looks up the listings for any of `directories` we have not retrieved yet and puts
+            them into our local cache. If there is more than one, we query them concurrently
+            (each in it's own thread), so it takes about the same time as querying one of them.
+
+            `DynamoProvider.get_item` calls this with the directory chain when it needs to
+            look up a directory.
+        """
+        local_cache = self.local_cache
+        to_fetch = []
+        for directory in directories:
+            if directory is None:
+                continue
+            directory = Directory.from_path(directory)
+            if directory not in local_cache and directory not in to_fetch:
+                to_fetch.append(directory)
+
+        if not to_fetch:
+            return
+
+        if len(to_fetch) == 1 or self.botocore_error_ignored_exception:
+            table = self._table
+            for directory in to_fetch:
+                self._store_listing(
+                    directory, lambda d=directory: list(table.get_items_for_directory(directory=d))
+                )
+            return
+
+        # Worker threads won't have our current context, so we get the client/table resources
+        # (and the settings they use) here. The low-level client is thread-safe and shared by
+        # the workers; if we only have table resources, each worker gets it's own, since boto
+        # resources are not thread-safe.
+        dynamo_resource = DynamoDBResource.grab()
+        client = dynamo_resource.raw_client()
+        table_name = self._table.table_name
+        tables = {
+            d: _ConfigDynamoTable(
+                table_name=table_name,
+                raw_client=client,
+                table=dynamo_resource.new_table_resource(table_name) if client is None else None
+            )
+            for d in to_fetch
+        }
+
+        def get_items(directory: Directory) -> List[DirectoryItem]:
+            return list(tables[directory].get_items_for_directory(directory=directory))
+
+        max_workers = min(_PREFETCH_MAX_WORKERS, len(to_fetch))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(d, executor.submit(get_items, d)) for d in to_fetch]
+
+        for directory, future in futures:
+            self._store_listing(directory, future.result)
+
+    def _store_listing(
+            self, directory: Directory, get_items: Callable[[], List[DirectoryItem]]
+    ) -> DirectoryListing:
+        """ Puts a listing for `directory` into our local cache with the items from `get_items`;
+            if that raises an error we are ignoring (see `handle_aws_exception`) the listing
+            will be empty.
+        """
         items = []
 
         try:
             if self.botocore_error_ignored_exception:
                 # Raise same error we previously had, and handle it the same way
                 # for this new directory.
-                log.info(
-                    f"We've already previously had a botocore error. Botocore error's [vs client"
-                    f"errors] are generally related to something that will keep failing. "
-                    f"Assuming we can't do anything with the service so bailing out early via "
-                    f"the same previous exception; for directory {directory}."
-                )
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        f"We've already previously had a botocore error. Botocore error's [vs "
+                        f"client errors] are generally related to something that will keep "
+                        f"failing. Assuming we can't do anything with the service so bailing out "
+                        f"early via the same previous exception; for directory {directory}."
+                    )
                 raise self.botocore_error_ignored_exception from None
 
-            items = list(self._table.get_items_for_directory(directory=directory))
+            items = get_items()
             self.log_about_items(items=items, path=directory.path)
         except Exception as e:
             # Will either re-raise the exception or handle it for us.
@@ -79,7 +155,7 @@ class DynamoProvider(AwsProvider):
 
         listing = DirectoryListing(directory=directory, items=items)
         self.local_cache[directory] = listing
-        return listing.get_item(name)
+        return listing
 
     def retrieved_items_map(
             self, directory: DirectoryOrPath
@@ -91,6 +167,10 @@ class DynamoProvider(AwsProvider):
         return listing.item_mapping()
 
 
+_PREFETCH_MAX_WORKERS = 8
+""" Most threads `DynamoProvider.prefetch_directories` will use at once. """
+
+
 class DynamoCacher(ProviderCacher):
     """ Uses a Dynamo table called `global-all-configCache`.
 
@@ -123,7 +203,6 @@ class DynamoCacher(ProviderCacher):
         normally only one of us around. See xinject library for more details.
     """
     name = "cacher"
-    _ttl: dt.datetime
 
     def retrieved_items_map(self, directory: DirectoryOrPath) -> Mapping[str, DirectoryItem]:
         """ This is mostly useful for getting this to cache, so I am not going to implement it
@@ -136,20 +215,34 @@ class DynamoCacher(ProviderCacher):
     @property
     def _table(self) -> _ConfigDynamoTable:
         # todo: make table name configurable
-        table = _ConfigDynamoTable(table_name='global-all-configCache', cache_table=True)
-        table.append_source = " - via cacher"
-        return table
+        return _ConfigDynamoTable(
+            table_name='global-all-configCache', cache_table=True, append_source=" - via cacher"
+        )
 
     @dataclasses.dataclass
     class _LocalCache:
-        listings: Dict[Directory, Dict[str, Dict[str, DirectoryListing]]] = dataclasses.field(
-            default_factory=(
-                lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(DirectoryListing)))
-            )
+        listings: Dict[Tuple[Directory, str, str], DirectoryListing] = dataclasses.field(
+            default_factory=lambda: {}
         )
+        """ `(environ, concatenated_directory_paths, concatenated_provider_names)` -> listing,
+            see `DynamoCacher._get_listing`.
+        """
         environ_to_items: Dict[Directory, Tuple[DirectoryItem]] = dataclasses.field(
             default_factory=lambda: {}
         )
+        environ_to_chain_index: Dict[
+            Directory, Dict[Tuple[str, str], List[DirectoryItem]]
+        ] = dataclasses.field(default_factory=lambda: {})
+        """ The `environ_to_items` items, by their
+            `(cache_concat_directory_paths, cache_concat_provider_names)`;
+            see `DynamoCacher._get_chain_index`.
+        """
+        environ_to_disk_cache_expires_at: Dict[Directory, float] = dataclasses.field(
+            default_factory=lambda: {}
+        )
+        """ When the disk cache file for environ expires (`time.time()` value),
+            if we are using one; see `xcon.conf.XconSettings.dynamo_cacher_disk_cache_dir`.
+        """
 
     @property
     def local_cache(self) -> _LocalCache:
@@ -173,13 +266,18 @@ class DynamoCacher(ProviderCacher):
         various things expire between various different services, to help spread load between
         param store and secrets manager aws api's.
 
-        12 hours in the future with a random +/- 1500 seconds added on is what we currently do.
+        12 hours in the future with a random +/- 1500 seconds added on is what we currently do
+        (see `DynamoCacher._ttl`).
         Thinking about making it a shorter period of time [a couple of hours].
         """
-        self._table.append_source = " - via cacher"
-
         super().__init__()
-        self._ttl = dt.datetime.now(dt.timezone.utc) + dt.timedelta(
+
+    @functools.cached_property
+    def _ttl(self) -> dt.datetime:
+        """ Default ttl for the items we cache; see `DynamoCacher.__init__` for details.
+            Calculated lazily, most cachers never write anything to the cache table.
+        """
+        return dt.datetime.now(dt.timezone.utc) + dt.timedelta(
             hours=12, seconds=random.randint(-1500, 1500)
         )
 
@@ -206,34 +304,36 @@ class DynamoCacher(ProviderCacher):
             provider_chain=provider_chain,
             environ=environ
         )
+        concat_dir_paths = directory_chain.concatenated_directory_paths
+        concat_provider_names = provider_chain.concatenated_provider_names
+        # Looked up once, instead of once per-item in the loop below.
+        default_ttl = self._ttl
+        environ_path = environ.path
+        add_to_listing = listing.add_item
         items_to_send = []
         for new_item in listing.get_items_with_different_value(items):
-            if new_item.cacheable:
-                ttl = self._ttl
+            if not new_item.cacheable:
+                continue
+
+            item_directory = new_item.directory
+            item_to_cache = DirectoryItem(
+                directory=item_directory,
+                name=new_item.name,
+                value=new_item.value,
+                source=f"{new_item.source} - {item_directory.path}",
                 # If the item has a ttl, we want to use that. It means it's a temporary value
                 # that should be looked up again after the expiration date.
-                if new_item.ttl:
-                    # We should never get a ttl less then the current time; but if we do we will
-                    # insert an item into cacher that will never be read by other processes
-                    # [since the cacher will filter them out via a dynamo query-filter].
-                    ttl = new_item.ttl
-
-                concat_dir_paths = directory_chain.concatenated_directory_paths
-                concat_provider_names = provider_chain.concatenated_provider_names
-
-                item_to_cache = DirectoryItem(
-                    directory=new_item.directory,
-                    name=new_item.name,
-                    value=new_item.value,
-                    source=f"{new_item.source} - {new_item.directory.path}",
-                    ttl=ttl,
-                    # DirectoryItem will calculate a cache_range_key for us with these two values:
-                    cache_concat_directory_paths=concat_dir_paths,
-                    cache_concat_provider_names=concat_provider_names,
-                    cache_hash_key=environ.path,
-                )
-                items_to_send.append(item_to_cache)
-                listing.add_item(item_to_cache)
+                # We should never get a ttl less then the current time; but if we do we will
+                # insert an item into cacher that will never be read by other processes
+                # [since the cacher will filter them out via a dynamo query-filter].
+                ttl=new_item.ttl or default_ttl,
+                # DirectoryItem will calculate a cache_range_key for us with these two values:
+                cache_concat_directory_paths=concat_dir_paths,
+                cache_concat_provider_names=concat_provider_names,
+                cache_hash_key=environ_path,
+            )
+            items_to_send.append(item_to_cache)
+            add_to_listing(item_to_cache)
 
         if not items_to_send:
             return
@@ -245,11 +345,12 @@ class DynamoCacher(ProviderCacher):
         )
 
         if self.directory_has_error(environ):
-            log.debug(
-                f"Not saving cached items to {environ}, it had an error reading/writing "
-                f"previously. See previous log messages [whenever the error happened for first "
-                f"time] for more details."
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    f"Not saving cached items to {environ}, it had an error reading/writing "
+                    f"previously. See previous log messages [whenever the error happened for "
+                    f"first time] for more details."
+                )
             return
 
         try:
@@ -258,6 +359,9 @@ class DynamoCacher(ProviderCacher):
             # Will either re-raise the exception or handle it for us.
             # It will also communicate to us via marking the directory as error'd on us if needed.
             handle_aws_exception(exception=e, provider=self, directory=environ)
+            return
+
+        self._add_to_disk_cache(environ, items_to_send)
 
     def get_item(
             self,
@@ -314,8 +418,11 @@ class DynamoCacher(ProviderCacher):
         dir_paths = directory_chain.concatenated_directory_paths
         provider_names = provider_chain.concatenated_provider_names
 
-        # defaultdict will provide default versions of all the objects as-needed.
-        listing = self.local_cache.listings[environ][dir_paths][provider_names]
+        listings = self.local_cache.listings
+        key = (environ, dir_paths, provider_names)
+        listing = listings.get(key)
+        if listing is None:
+            listing = listings[key] = DirectoryListing()
 
         # If we have a directory assigned to object [defaults to None], then we know we
         # have retrieved it in the past at some point, return it.
@@ -323,38 +430,71 @@ class DynamoCacher(ProviderCacher):
             return listing
 
         listing.directory = environ
-        items = self._get_items_for_environ(environ=environ)
-        concat_directory_paths = directory_chain.concatenated_directory_paths
-        concat_provider_names = provider_chain.concatenated_provider_names
-        for item in items:
-            # find all items in the environ items that match my directory/provider lists.
-            # IF they do match, then it's safe to use the cached value.
-            if item.cache_concat_directory_paths != concat_directory_paths:
-                continue
-            if item.cache_concat_provider_names != concat_provider_names:
-                continue
+
+        # Only the environ items that match my directory/provider lists,
+        # they are the ones it's safe to use the cached value of.
+        chain_index = self._get_chain_index(environ=environ)
+        for item in chain_index.get((dir_paths, provider_names), ()):
             listing.add_item(item)
         return listing
 
+    def _get_chain_index(self, environ: Directory) -> Dict[Tuple[str, str], List[DirectoryItem]]:
+        """ Items from `_get_items_for_environ`, by their
+            `(cache_concat_directory_paths, cache_concat_provider_names)`; so we don't have to
+            go through all of them for each directory/provider chain we are asked about.
+        """
+        environ_to_chain_index = self.local_cache.environ_to_chain_index
+        chain_index = environ_to_chain_index.get(environ)
+        if chain_index is not None:
+            return chain_index
+
+        chain_index = {}
+        for item in self._get_items_for_environ(environ=environ):
+            key = (item.cache_concat_directory_paths, item.cache_concat_provider_names)
+            chain_index.setdefault(key, []).append(item)
+
+        environ_to_chain_index[environ] = chain_index
+        return chain_index
+
     def _get_items_for_environ(self, environ: Directory) -> Iterable[DirectoryItem]:
         items = self.local_cache.environ_to_items.get(environ)
         if items is not None:
             return items
 
+        # Items expiring before this are left out (so they get looked up again a bit early);
+        # randomized so every process does not look them up again at the same time.
         now = dt.datetime.now(dt.timezone.utc)
         expire_time = now + dt.timedelta(seconds=random.randint(0, 60 * 60 * 2))
-        try:
-            items = self._table.get_items_for_directory(directory=environ, expire_time=expire_time)
-
-            # Ensure we have a list, and not a generator.
-            items = tuple(xloop(items, default_not_iterate=[str]))
 
-            # Log about stuff we retrieved from the cache table.
-            self.log_about_items(items=items, path=environ.path)
-        except Exception as e:
-            # Will either re-raise the exception or handle it for us.
-            handle_aws_exception(exception=e, directory=environ, provider=self)
-            items = tuple()
+        disk_cache_path = self._disk_cache_path(environ)
+        if disk_cache_path:
+            items, expires_at = _read_disk_cache(disk_cache_path, expire_time=expire_time)
+            if items is not None:
+                self.local_cache.environ_to_disk_cache_expires_at[environ] = expires_at
+
+        if items is None:
+            try:
+                # Ensure we have a tuple, and not a generator.
+                items = tuple(self._table.get_items_for_directory(
+                    directory=environ, expire_time=expire_time
+                ))
+
+                # Log about stuff we retrieved from the cache table.
+                self.log_about_items(items=items, path=environ.path)
+            except Exception as e:
+                # Will either re-raise the exception or handle it for us.
+                handle_aws_exception(exception=e, directory=environ, provider=self)
+                items = tuple()
+            else:
+                if disk_cache_path:
+                    expire_delta = InternalLocalProviderCache.grab().expire_time_delta
+                    expires_at = time.time() + expire_delta.total_seconds()
+                    self.local_cache.environ_to_disk_cache_expires_at[environ] = expires_at
+                    _write_disk_cache(disk_cache_path, items, expires_at)
+        else:
+            self.log_about_items(
+                items=items, path=environ.path, msg_prefix="Retrieved from disk cache"
+            )
 
         self.local_cache.environ_to_items[environ] = items
         if not items:
@@ -376,6 +516,63 @@ class DynamoCacher(ProviderCacher):
 
         return items
 
+    def _disk_cache_path(self, environ: Directory) -> Optional[Path]:
+        """ Disk cache file for `environ`, if we are using them;
+            see `xcon.conf.XconSettings.dynamo_cacher_disk_cache_dir`.
+        """
+        # Importing here to avoid circular imports.
+        from xcon import xcon_settings
+        disk_cache_dir = xcon_settings.dynamo_cacher_disk_cache_dir
+        if not disk_cache_dir:
+            return None
+
+        # Other aws accounts/regions (or cache tables) can have the same environ on this host,
+        # so the file is for all of them together.
+        table = self._table
+        try:
+            # Client first; creating it resolves the session's credentials, which it then keeps.
+            client_meta = table.table.meta.client.meta
+            credentials = boto_session.session.get_credentials()
+        except Exception as e:
+            log.debug(f"Unable to get identity to name the config disk cache file; error: {e}")
+            return None
+
+        if credentials is None:
+            return None
+
+        key = '\n'.join((
+            # An access key only belongs to one aws account.
+            credentials.access_key,
+            client_meta.region_name or '',
+            client_meta.endpoint_url or '',
+            table.table_name,
+            environ.path,
+        ))
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return Path(disk_cache_dir) / f"xcon-cache-{name}.json"
+
+    def _add_to_disk_cache(self, environ: Directory, items: Sequence[DirectoryItem]):
+        """ Adds items we just put into the cache table to the disk cache file for `environ`
+            (if we are using one), so other processes don't need to look them up again.
+
+            The file keeps the same expiration time it had, so values still get looked up
+            fresh from the cache table regularly.
+        """
+        local_cache = self.local_cache
+        expires_at = local_cache.environ_to_disk_cache_expires_at.get(environ)
+        if not expires_at or expires_at <= time.time():
+            return
+
+        disk_cache_path = self._disk_cache_path(environ)
+        if not disk_cache_path:
+            return
+
+        # Later items win over earlier ones with the same name (see `_get_listing`).
+        all_items = tuple(local_cache.environ_to_items.get(environ, ())) + tuple(items)
+        local_cache.environ_to_items[environ] = all_items
+        local_cache.environ_to_chain_index.pop(environ, None)
+        _write_disk_cache(disk_cache_path, all_items, expires_at)
+
     def _get_environ_to_use(
         self, passed_in_environ: Optional[Directory] = None
     ) -> Optional[Directory]:
@@ -397,6 +594,72 @@ class DynamoCacher(ProviderCacher):
         return Directory(service=e_service, env=e_env)
 
 
+def _read_disk_cache(
+        path: Path, expire_time: dt.datetime
+) -> Tuple[Optional[Tuple[DirectoryItem, ...]], float]:
+    """ Items from the `DynamoCacher` disk cache file at `path` and when the file expires;
+        items are None if there is no file (or it has expired, or is malformed).
+
+        Items with a `ttl` at/before `expire_time` are left out, the same as the cache table
+        query does (see `_ConfigDynamoTable.get_items_for_directory`).
+    """
+    try:
+        with path.open() as f:
+            data = json.load(f)
+
+        expires_at = data.get('expires_at', 0)
+        if expires_at <= time.time():
+            return None, 0
+
+        expire_timestamp = int(expire_time.timestamp())
+        items = []
+        for item_json in map(_deserialize_item, data['items']):
+            # Don't use items that have expired since we wrote them out.
+            if item_json.get('ttl', expire_timestamp + 1) <= expire_timestamp:
+                continue
+            # The `source` in the file already has what the cache table appended to it.
+            items.append(DirectoryItem.from_json(json=item_json, from_cacher=True))
+    except FileNotFoundError:
+        return None, 0
+    except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+        # Anything not quite right about the file (ie: partly written, or from an older
+        # version), we just treat it as not being there; it gets written again.
+        log.warning(f"Unable to read config disk cache file ({path}), ignoring it; error: {e}")
+        return None, 0
+    return tuple(items), expires_at
+
+
+def _write_disk_cache(path: Path, items: Sequence[DirectoryItem], expires_at: float):
+    """ Writes `items` to the `DynamoCacher` disk cache file at `path`,
+        usable until `expires_at` (a `time.time()` value).
+
+        The values are written as-is (including any from `SecretsManagerProvider`);
+        the file is only readable by the current user (see `tempfile.mkstemp`).
+    """
+    data = {
+        'expires_at': expires_at,
+        # In dynamo's format, so we get the same (ie: `Decimal`) values back when read.
+        'items': [
+            {k: _serialize_attribute_value(v) for k, v in item.json().items()} for item in items
+        ],
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and then move it into place,
+        # so other processes never see a partially written file.
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError as e:
+        log.warning(f"Unable to write config disk cache file ({path}); error: {e}")
+
+
 class DynamoDBResource(Dependency):
     dynamodb_xboto_resource: BotoResources.DynamoDB | DefaultType = Default
     _table_name_to_boto_resource: dict[str, Any]
@@ -404,20 +667,158 @@ class DynamoDBResource(Dependency):
     def __init__(self, dynamodb_xboto_resource: BotoResources.DynamoDB | DefaultType = Default):
         self.dynamodb_xboto_resource = dynamodb_xboto_resource
         self._table_name_to_boto_resource = {}
+        self._dax_client = None
+        self._raw_client = None
 
     def table_resource(self, table_name):
         if resource := self._table_name_to_boto_resource.get(table_name):
             return resource
 
-        if self.dynamodb_xboto_resource is Default:
-            dynamodb = BotoResources.grab().dynamodb
-        else:
-            dynamodb = self.dynamodb_xboto_resource.boto_resource
-
-        resource = dynamodb.Table(table_name)
+        resource = self.new_table_resource(table_name)
         self._table_name_to_boto_resource[table_name] = resource
         return resource
 
+    def new_table_resource(self, table_name):
+        """ Returns a new table resource that is not shared/remembered like `table_resource`;
+            boto resources are not thread-safe, so this is what to use from a worker thread
+            (the boto resource is grabbed for the current thread).
+        """
+        # Importing here to avoid circular imports.
+        from xcon import xcon_settings
+
+        if self.dynamodb_xboto_resource is not Default:
+            dynamodb = self.dynamodb_xboto_resource.boto_resource
+        elif dax_endpoint := xcon_settings.dynamo_dax_endpoint:
+            dynamodb = _dax_resource(dax_endpoint)
+        else:
+            dynamodb = BotoResources.grab().dynamodb
+
+        return dynamodb.Table(table_name)
+
+    def raw_client(self):
+        """ Returns a low-level dynamodb client, one that leaves items in dynamo's own format
+            (the client from a table resource converts them to python values for us,
+            which is slower; see `_ConfigDynamoTable.get_items_for_directory`).
+
+            Low-level clients are thread-safe, so we create one (configured with
+            `_DYNAMO_CLIENT_CONFIG`) and share it with any worker threads;
+            they then share its connection pool too.
+
+            Returns None if we were given an explicit `dynamodb_xboto_resource`,
+            as we only have a resource to use in that case.
+        """
+        if self.dynamodb_xboto_resource is not Default:
+            return None
+
+        # Importing here to avoid circular imports.
+        from xcon import xcon_settings
+
+        if dax_endpoint := xcon_settings.dynamo_dax_endpoint:
+            # The DAX client is thread-safe, and expensive to create (it discovers the cluster).
+            dax_client = self._dax_client
+            if dax_client is None:
+                dax_client = _dax_client_class(dax_endpoint)(endpoint_url=dax_endpoint)
+                self._dax_client = dax_client
+            return dax_client
+
+        raw_client = self._raw_client
+        if raw_client is None:
+            # Any client args configured in the current `xboto.dependencies.BotoClient`
+            # dependency for dynamodb take precedence over ours.
+            boto_kwargs = BotoClient.get_dependency_cls('dynamodb').grab().boto_kwargs
+            raw_client = boto_session.session.client(
+                'dynamodb', **{'config': _DYNAMO_CLIENT_CONFIG, **boto_kwargs}
+            )
+            self._raw_client = raw_client
+        return raw_client
+
+
+def _dax_client_class(endpoint_url: str):
+    """ The `AmazonDaxClient` class, for the DAX cluster at `endpoint_url`
+        (see `xcon.conf.XconSettings.dynamo_dax_endpoint`).
+    """
+    try:
+        from amazondax import AmazonDaxClient
+    except ImportError as e:
+        raise ConfigError(
+            f"A DAX endpoint ({endpoint_url}) was configured via `XCON_DYNAMO_DAX_ENDPOINT`, "
+            f"but the `amazon-dax-client` package is not installed."
+        ) from e
+    return AmazonDaxClient
+
+
+def _dax_resource(endpoint_url: str):
+    """ A DynamoDB resource that goes though the DAX cluster at `endpoint_url`,
+        see `xcon.conf.XconSettings.dynamo_dax_endpoint`.
+    """
+    return _dax_client_class(endpoint_url).resource(endpoint_url=endpoint_url)
+
+
+_DYNAMO_CLIENT_CONFIG = BotocoreConfig(
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 4},
+    tcp_keepalive=True,
+)
+""" Used for `DynamoDBResource.raw_client`, it's shared by the threads that
+    `DynamoProvider.prefetch_directories` uses; so we allow more connections than the
+    default of 10, keep them alive and use adaptive retries, which back off and
+    client-side rate-limit the shared client when dynamo throttles us.
+"""
+
+_deserialize_attribute_value = TypeDeserializer().deserialize
+""" Converts a value from dynamo's format (ie: `{"S": "some-str"}`) into a python value. """
+
+_serialize_attribute_value = TypeSerializer().serialize
+""" Converts a python value into dynamo's format (ie: `{"S": "some-str"}`). """
+
+
+def _deserialize_item(item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """ Converts an item from dynamo's format into a dict of python values. """
+    return {k: _deserialize_attribute_value(v) for k, v in item.items()}
+
+
+_BATCH_WRITE_MAX_ITEMS = 25
+""" Most items dynamo allows in a single `batch_write_item` call. """
+
+_BATCH_WRITE_MAX_WORKERS = 4
+_BATCH_WRITE_MAX_ATTEMPTS = 8
+_BATCH_WRITE_INITIAL_DELAY = 0.05
+_BATCH_WRITE_MAX_DELAY = 2.0
+""" Seconds, see `_ConfigDynamoTable.put_items`. """
+
+_batch_write_executor_lock = threading.Lock()
+_batch_write_executor_instance: Optional[ThreadPoolExecutor] = None
+
+
+def _batch_write_executor() -> ThreadPoolExecutor:
+    """ Thread pool `_ConfigDynamoTable.put_items` sends it's batches with; created the first
+        time it's needed and then shared (vs starting up new threads for every write).
+    """
+    global _batch_write_executor_instance
+    executor = _batch_write_executor_instance
+    if executor is None:
+        with _batch_write_executor_lock:
+            executor = _batch_write_executor_instance
+            if executor is None:
+                executor = _batch_write_executor_instance = ThreadPoolExecutor(
+                    max_workers=_BATCH_WRITE_MAX_WORKERS,
+                    thread_name_prefix='xcon-dynamo-batch-write',
+                )
+    return executor
+
+
+_ITEM_ATTRIBUTES = (
+    'app_key', 'name_key', 'directory', 'name', 'real_directory', 'real_name', 'original_name',
+    'value', 'ttl', 'source', 'created_at',
+    'cache_concat_directory_paths', 'cache_concat_provider_names',
+)
+""" Table attributes that `xcon.directory.DirectoryItem.from_json` uses. """
+
+_ITEM_PROJECTION_ATTRIBUTE_NAMES = {f'#{a}': a for a in _ITEM_ATTRIBUTES}
+# Several of the attributes are reserved words in dynamo (ie: `name`, `value`, `ttl`),
+# so we refer to all of them via their `#` placeholder names.
+_ITEM_PROJECTION_EXPRESSION = ', '.join(_ITEM_PROJECTION_ATTRIBUTE_NAMES)
+
 
 # Most of this code could be shared from `xmodel_dynamo`, but we don't want to import that
 # in this library (it's a bit heavy).  So for now, we are duplicating some of that functionality
@@ -446,18 +847,47 @@ class _ConfigDynamoTable:
         """ DynamoDB table resource.
             We lazily get the resource, so we don't have to verify/create it if not needed.
         """
+        if self._table is not None:
+            return self._table
         return DynamoDBResource.grab().table_resource(self.table_name)
 
     def __init__(
             self,
             table_name: str,
-            cache_table: bool = False
+            cache_table: bool = False,
+            raw_client: Any = Default,
+            table: Any = None,
+            append_source: Optional[str] = None
     ):
+        """
+        Args:
+            table_name: Name of the dynamo table.
+            cache_table: If True, items are from the cache table (see `DynamoCacher`).
+            raw_client: If provided, the low-level client to use instead of the one from the
+                current `DynamoDBResource` (see `DynamoDBResource.raw_client`);
+                None means to use the table resource.
+            table: If provided, the table resource to use instead of the one from the
+                current `DynamoDBResource`.
+
+                Both are for worker threads, as they won't have the caller's current
+                dependencies/settings; so the caller gets them and passes them in.
+            append_source: Appended to the `xcon.directory.DirectoryItem.source` of the items
+                we retrieve; if None, we use the `_ConfigDynamoTable.append_source` default.
+        """
         super().__init__()
         self._table_name = table_name
-        self._table = None
+        self._table = table
+        self._raw_client = raw_client
         self._verified_table_status = False
         self._cache_table = cache_table
+        if append_source is not None:
+            self.append_source = append_source
+
+        # Bake in what is the same for every item we retrieve,
+        # so `_paginate_all_items_generator` does not have to look it up per-item.
+        self._from_json = functools.partial(
+            DirectoryItem.from_json, append_source=self.append_source, from_cacher=cache_table
+        )
 
     def put_item(self, item: DirectoryItem):
         """ Put item into dynamo-table.
@@ -473,20 +903,53 @@ class _ConfigDynamoTable:
         resource.put_item(Item=item.json())
 
     def put_items(self, items: Sequence[DirectoryItem]):
-        """ Uses a batch-writer to put the items.
+        """ Puts the items via `batch_write_item`, 25 at a time (the most dynamo allows);
             WAY more efficient than doing it one at a time.
-            If you only give me one item, directly calls `put_item` without a batch-writer.
+
+            If there is more than one batch, they are sent concurrently. Any items dynamo
+            leaves unprocessed are retried, with a backoff; if some are still unprocessed after
+            that, we log a warning and drop them (it's only a cache, they get looked up
+            and cached again later).
+
+            If you only give me one item (or we are in a `_with_batch_writer`),
+            directly calls `put_item` instead.
         """
         if not items:
             return
 
-        if len(items) == 1:
-            self.put_item(item=items[0])
-            return
-
-        with self._with_batch_writer():
+        if len(items) == 1 or self._batch_writer:
             for i in items:
                 self.put_item(item=i)
+            return
+
+        # Dynamo won't accept the same key twice in one batch, last one wins
+        # (same as what the boto batch-writer did via it's `overwrite_by_pkeys`).
+        requests = {}
+        for i in items:
+            item_json = i.json()
+            requests[(item_json['app_key'], item_json['name_key'])] = {
+                'PutRequest': {'Item': item_json}
+            }
+        requests = list(requests.values())
+
+        # Boto clients are thread-safe (unlike resources), so all batches can share this one.
+        # The table resource's client still converts our python values into dynamo's format
+        # for us, the same as the table resource would.
+        client = self.table.meta.client
+        batches = [
+            requests[i:i + _BATCH_WRITE_MAX_ITEMS]
+            for i in range(0, len(requests), _BATCH_WRITE_MAX_ITEMS)
+        ]
+
+        if len(batches) == 1:
+            self._batch_write(client, batches[0])
+            return
+
+        executor = _batch_write_executor()
+        futures = [executor.submit(self._batch_write, client, b) for b in batches]
+        for future in futures:
+            # Raises the error, if there was one.
+            future.result()
 
     def delete_items(self, items: Iterable[DirectoryItem]):
         # This is really only used with unit-tests, I am not going to try to batch-delete
@@ -522,41 +985,73 @@ class _ConfigDynamoTable:
         :return:
         """
         dir_path = Directory.from_path(directory).path
-        expression = conditions.Key('app_key').eq(dir_path)
 
-        log.info(f"Getting Dynamo directory ({directory.path}).")
+        log.info(f"Getting Dynamo directory ({dir_path}).")
 
         if expire_time is Default:
             expire_time = dt.datetime.now(dt.timezone.utc)
 
-        filter_exp = None
-        if expire_time is not None:
-            ttl_attr = conditions.Attr('ttl')
-            filter_exp = ttl_attr.not_exists() | ttl_attr.gt(int(expire_time.timestamp()))
+        # We write the expressions out ourselves (once), instead of using
+        # `boto3.dynamodb.conditions` objects that boto would turn into these same strings
+        # for every page.
+        query = {
+            # I think we are fine without a `ConsistentRead`, we rarely write/put things,
+            # And if it was out-of-date it would only be by a matter of seconds which really
+            # does not matter to us in this context.
+            #
+            # "ConsistentRead": True,
+
+            # Expression for the directory-partition we want.
+            "KeyConditionExpression": "#app_key = :app_key",
+            # Only get back the attributes `DirectoryItem.from_json` will look at.
+            "ProjectionExpression": _ITEM_PROJECTION_EXPRESSION,
+            "ExpressionAttributeNames": dict(_ITEM_PROJECTION_ATTRIBUTE_NAMES),
+            "ExpressionAttributeValues": {":app_key": dir_path},
+        }
 
-        def response_creator(last_key: str):
-            query = {
-                # I think we are fine without a `ConsistentRead`, we rarely write/put things,
-                # And if it was out-of-date it would only be by a matter of seconds which really
-                # does not matter to us in this context.
-                #
-                # "ConsistentRead": True,
-
-                # Expression for the directory-partition we want.
-                "KeyConditionExpression": expression,
+        if expire_time is not None:
+            # Expired items still count against the read capacity of the query, but only until
+            # dynamo's TTL process deletes them. A sparse 'only-live-items' key/index can't
+            # replace this filter: an item is live when it's written and only expires later,
+            # so the filter would still be needed (and the table's keys would have to change).
+            query["FilterExpression"] = "attribute_not_exists(#ttl) OR #ttl > :ttl"
+            query["ExpressionAttributeNames"]["#ttl"] = "ttl"
+            query["ExpressionAttributeValues"][":ttl"] = int(expire_time.timestamp())
+
+        client = self._raw_client
+        if client is Default:
+            client = DynamoDBResource.grab().raw_client()
+        if client is None:
+            query_func = self.table.query
+        else:
+            # Use a low-level client and convert the items ourselves, it's quite a bit quicker
+            # than the table resource's client converting them based on the service model.
+            query_func = client.query
+            query["TableName"] = self.table_name
+            query["ExpressionAttributeValues"] = {
+                k: _serialize_attribute_value(v)
+                for k, v in query["ExpressionAttributeValues"].items()
             }
 
-            if filter_exp:
-                query["FilterExpression"] = filter_exp
+        def response_creator(last_key: str):
+            if not last_key:
+                return query_func(**query)
+            return query_func(**query, ExclusiveStartKey=last_key)
 
-            if last_key:
-                query["ExclusiveStartKey"] = last_key
+        return self._paginate_all_items_generator(
+            response_creator, raw_items=client is not None
+        )
 
-            return self.table.query(**query)
+    def get_all_items(self, total_segments: int = 1) -> Iterable[DirectoryItem]:
+        """ Scans the entire table, returning every item in it.
 
-        return self._paginate_all_items_generator(response_creator)
+            If `total_segments` is more than 1, we do a parallel scan with that many segments
+            (each segment is scanned in it's own thread, via it's own table resource).
+            Items are returned a segment at a time, as each segment finishes.
+        """
+        if total_segments > 1:
+            return self._parallel_scan_generator(total_segments)
 
-    def get_all_items(self) -> Iterable[DirectoryItem]:
         def response_creator(last_key: str):
             if last_key is None:
                 return self.table.scan()
@@ -581,23 +1076,72 @@ class _ConfigDynamoTable:
                     table.put_item(item)
             ```
 
-            Or you can use `put_items` and just give it a list of items, and it will do
-            this for you (create and use a batch writer).
+            Or you can use `put_items` and just give it a list of items, and it will
+            batch them for you.
         """
         return self._BatchTable(self)
 
     # ----------------------------
     # --------- Private ----------
 
+    def _batch_write(self, client, requests: List[dict]):
+        """ Sends `requests` via `batch_write_item`, retrying any unprocessed ones. """
+        table_name = self.table_name
+        delay = _BATCH_WRITE_INITIAL_DELAY
+        for _ in range(_BATCH_WRITE_MAX_ATTEMPTS):
+            response = client.batch_write_item(RequestItems={table_name: requests})
+            requests = response.get('UnprocessedItems', {}).get(table_name)
+            if not requests:
+                return
+
+            # Dynamo is throttling us, back off a bit before sending the rest.
+            time.sleep(random.uniform(delay / 2, delay))
+            delay = min(delay * 2, _BATCH_WRITE_MAX_DELAY)
+
+        log.warning(
+            f"Unable to put {len(requests)} item(s) into dynamo table ({table_name}); "
+            f"they were still unprocessed after {_BATCH_WRITE_MAX_ATTEMPTS} attempts, "
+            f"dropping them."
+        )
+
     _table_name: str
     _verified_table_status: bool
     _batch_writer = None
 
+    def _parallel_scan_generator(self, total_segments: int) -> Iterable[DirectoryItem]:
+        # Worker threads won't have our current context, so we get their table resources
+        # (and the settings/boto resources they use) here; one each, as boto resources
+        # are not thread-safe.
+        dynamo_resource = DynamoDBResource.grab()
+        table_name = self.table_name
+        tables = [dynamo_resource.new_table_resource(table_name) for _ in range(total_segments)]
+
+        def scan_segment(segment: int) -> List[DirectoryItem]:
+            table = tables[segment]
+
+            def response_creator(last_key: str):
+                scan = {"Segment": segment, "TotalSegments": total_segments}
+                if last_key is not None:
+                    scan["ExclusiveStartKey"] = last_key
+                return table.scan(**scan)
+
+            return list(self._paginate_all_items_generator(response_creator))
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            futures = [executor.submit(scan_segment, s) for s in range(total_segments)]
+            for future in as_completed(futures):
+                yield from future.result()
+
     def _paginate_all_items_generator(
-            self, response_creator: Callable[[Optional[str]], dict]
+            self, response_creator: Callable[[Optional[str]], dict], raw_items: bool = False
     ) -> Iterable[DirectoryItem]:
+        """ Yields the items from each response page.
+
+            If `raw_items` is True, the items are still in dynamo's own format
+            (from a low-level client, see `DynamoDBResource.raw_client`), we convert them.
+        """
         last_key: Optional[str] = None
-        append_source = self.append_source
+        from_json = self._from_json
 
         while True:
             response = response_creator(last_key)
@@ -607,12 +1151,10 @@ class _ConfigDynamoTable:
             if not db_datas:
                 db_datas = []
 
-            for data in db_datas:
-                yield DirectoryItem.from_json(
-                    json=data,
-                    append_source=append_source,
-                    from_cacher=self._cache_table
-                )
+            # Convert the whole page via `map`, so there is no python-level loop per-item here.
+            if raw_items:
+                db_datas = map(_deserialize_item, db_datas)
+            yield from map(from_json, db_datas)
 
             if not last_key:
                 return
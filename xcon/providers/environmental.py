@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import os
-from typing import Optional, Mapping, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Mapping, Dict, Any, Iterable, Tuple
 
 from xcon.directory import (
-    DirectoryOrPath, DirectoryItem, DirectoryChain, Directory, DirectoryListing
+    DirectoryOrPath, DirectoryItem, DirectoryChain, Directory, DirectoryListing, _norm_name
 )
 from xcon.provider import Provider, ProviderChain, InternalLocalProviderCache
 
 
+_EMPTY_MAP: Mapping[str, DirectoryItem] = MappingProxyType({})
+""" Read-only empty map returned by `EnvironmentalProvider.retrieved_items_map`
+    (vs allocating a new dict each time the provider-chain asks for it).
+"""
+
+
 class EnvironmentalProvider(Provider):
     """
     Provides config values out of the current processes environmental variables.
@@ -32,7 +39,7 @@ class EnvironmentalProvider(Provider):
     ...         assert config.SOME_ENV_VAR == 'some-value'
     """
 
-    _user_provided_cache: DirectoryListing = None
+    _user_provided_cache: _EnvListing = None
     """ If user provided the 'cache' of names/values, we store it here so it's permanent
         and won't expire like the normal env-var cache will.
 
@@ -41,7 +48,7 @@ class EnvironmentalProvider(Provider):
     """
 
     @property
-    def local_cache(self) -> DirectoryListing:
+    def local_cache(self) -> _EnvListing:
         # Using default dict so I don't have to worry about allocating the dict's my self later.
         if self._user_provided_cache is not None:
             return self._user_provided_cache
@@ -95,29 +102,21 @@ class EnvironmentalProvider(Provider):
         # IMPORTANT: DO NOT use `self.local_cache` in this method,
         #            self.local_cache can call me to create cached snapshot!
 
-        listing = DirectoryListing()
-
         if from_env_dict is None:
             # If an internal cacher not provided, get current one.
             if not internal_cache_provider:
                 internal_cache_provider = InternalLocalProviderCache.grab()
 
-            from_env_dict = os.environ
+            listing = _environ_listing(source=self.name)
             msg_prefix = "Snapshotted os.environ"
             internal_cache_provider.set_cache_for_provider(
                 provider=self, cache=listing
             )
         else:
+            listing = _EnvListing(env_vars=from_env_dict, source=self.name)
             msg_prefix = "Given (User Provided)"
             self._user_provided_cache = listing
 
-        for k, v in from_env_dict.items():
-            item = DirectoryItem(
-                directory="/_environmental", name=k, value=v, cacheable=False,
-                source=self.name
-            )
-            listing.add_item(item)
-
         self._log_msg_prefix = msg_prefix
         self._log_about_environmental_snapshot()
 
@@ -125,9 +124,10 @@ class EnvironmentalProvider(Provider):
         """ Will log out the names of what environmental variables I snapshot,
             if the snapshot exists (it's normally lazily Snapshotted first time it's needed).
         """
+        # Only called if this is really logged, creating all the snapshot's items is not free.
         self.log_about_items(
-            items=self.local_cache.item_mapping().values(),
-            path='/_environmental',
+            items=lambda: self.local_cache.item_mapping().values(),
+            path=_ENV_DIRECTORY.path,
             msg_prefix=self._log_msg_prefix
         )
 
@@ -142,7 +142,8 @@ class EnvironmentalProvider(Provider):
         Args:
             name (str): We upper case this string for you and look in `os.getenv()` for the value.
         """
-        # Snapshot cache uses lower-case keys, see `EnvironmentalProvider._create_snapshot`.
+        # Snapshot cache uses lower-case keys and normalizes the name for us,
+        # see `EnvironmentalProvider._create_snapshot` and `_EnvListing.get_item`.
         return self.local_cache.get_item(name)
 
     def get_value_without_environ(self, name: str) -> Optional[str]:
@@ -156,12 +157,8 @@ class EnvironmentalProvider(Provider):
         Args:
             name (str): We upper case this string for you and look in `os.getenv()` for the value.
         """
-        # Consider looking for any case, for now only look for upper-case names.
-        item = self.get_item_without_environ(name=name)
-        if item is None:
-            return None
-
-        return item.value
+        # Only the value is needed, so the snapshot does not have to create an item for it.
+        return self.local_cache.get_value(name)
 
     def get_item(
             self,
@@ -189,4 +186,136 @@ class EnvironmentalProvider(Provider):
             We don't want to return None, the ProviderChain uses {} vs None to decide if it should
             stop looking for more `retrieved_items_map` as a safety mechanism.
         """
-        return {}
+        return _EMPTY_MAP
+
+
+_last_environ_snapshot: Optional[Tuple[Dict[str, str], Dict[str, tuple]]] = None
+""" (copy of `os.environ`, it's variables by lower-cased name) of the last `os.environ`
+    snapshot, see `_environ_listing`.
+"""
+
+_ENV_DIRECTORY = Directory.from_path('/_environmental')
+""" Directory for all of `EnvironmentalProvider`'s items; the items all share this one object
+    (vs each item looking up the directory for the path).
+"""
+
+
+def _environ_listing(source: str) -> _EnvListing:
+    """ New listing with a snapshot of `os.environ`; if it has not changed since the last
+        snapshot we made (ie: after the `InternalLocalProviderCache` expired), the listing
+        shares the lower-cased variables of that snapshot (vs lower-casing them all again).
+
+        Each provider cache still gets it's own listing, so changing one
+        (ie: `_EnvListing.remove_item_with_name`) does not effect any others.
+    """
+    global _last_environ_snapshot
+    env_vars = dict(os.environ)
+
+    last_snapshot = _last_environ_snapshot
+    if last_snapshot and last_snapshot[0] == env_vars:
+        lowered_env_vars = last_snapshot[1]
+    else:
+        lowered_env_vars = _lower_env_vars(env_vars)
+        _last_environ_snapshot = (env_vars, lowered_env_vars)
+
+    return _EnvListing(env_vars=None, source=source, shared_env_vars=lowered_env_vars)
+
+
+def _lower_env_vars(env_vars: Mapping[str, Any]) -> Dict[str, tuple]:
+    """ Lower-cased names (like `DirectoryItem.name`) -> (original name, value);
+        when two names only differ by case, the last one wins (same as adding the items).
+    """
+    return {k.lower(): (k, v) for k, v in env_vars.items()}
+
+
+class _EnvListing(DirectoryListing):
+    """ Snapshot of environmental variables for `EnvironmentalProvider`.
+
+        Normally only a few of the variables are ever looked up, so we only create the
+        `xcon.directory.DirectoryItem` for a variable the first time it's asked for
+        (or when all of them are needed, ie: via `item_mapping`).
+    """
+
+    def __init__(
+            self,
+            env_vars: Optional[Mapping[str, Any]],
+            source: str,
+            shared_env_vars: Optional[Dict[str, tuple]] = None
+    ):
+        """
+        Args:
+            env_vars: Names/values of the variables.
+            source: Source for the items.
+            shared_env_vars: Used instead of `env_vars` if provided, the result of
+                `_lower_env_vars` that other listings may also be using; we don't change it
+                (we make our own copy first if we need to).
+        """
+        super().__init__()
+        self._source = source
+        self._created_all_items = False
+        self._shares_env_vars = shared_env_vars is not None
+        self._env_vars: Dict[str, tuple] = (
+            shared_env_vars if self._shares_env_vars else _lower_env_vars(env_vars)
+        )
+
+    def get_item(self, name: str) -> Optional[DirectoryItem]:
+        # We are asked for the same few names over and over,
+        # `_norm_name` remembers their lower-cased form instead of lower-casing them every time.
+        name = _norm_name(name)
+        item = self._items.get(name)
+        if item is not None:
+            return item
+
+        name_and_value = self._env_vars.get(name)
+        if name_and_value is None:
+            return None
+
+        original_name, value = name_and_value
+        item = self._items[name] = DirectoryItem(
+            directory=_ENV_DIRECTORY, name=original_name, value=value, cacheable=False,
+            source=self._source
+        )
+        return item
+
+    def get_value(self, name: str) -> Optional[Any]:
+        """ Same as `get_item(name).value` (None if there is no item),
+            without having to create the item.
+        """
+        name = _norm_name(name)
+        item = self._items.get(name)
+        if item is not None:
+            return item.value
+
+        name_and_value = self._env_vars.get(name)
+        if name_and_value is None:
+            return None
+        return name_and_value[1]
+
+    def get_any_item(self) -> Optional[DirectoryItem]:
+        self._create_all_items()
+        return super().get_any_item()
+
+    def remove_item_with_name(self, name: str):
+        if self._shares_env_vars:
+            # Other listings use the shared one, so we need our own before changing it.
+            self._env_vars = dict(self._env_vars)
+            self._shares_env_vars = False
+        self._env_vars.pop(_norm_name(name), None)
+        super().remove_item_with_name(name)
+
+    def get_items_with_different_value(
+        self, items: Iterable[DirectoryItem]
+    ) -> Iterable[DirectoryItem]:
+        self._create_all_items()
+        return super().get_items_with_different_value(items)
+
+    def item_mapping(self) -> Mapping[str, DirectoryItem]:
+        self._create_all_items()
+        return super().item_mapping()
+
+    def _create_all_items(self):
+        if self._created_all_items:
+            return
+        for name in self._env_vars:
+            self.get_item(name)
+        self._created_all_items = True
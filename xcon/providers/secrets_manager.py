@@ -4,22 +4,26 @@ import dataclasses
 import logging
 
 import base64
+from collections import defaultdict
 from typing import Dict, Optional, Any, Mapping
 
 from .common import handle_aws_exception
-from ..directory import Directory, DirectoryListing, DirectoryOrPath, DirectoryItem, DirectoryChain
+from ..directory import (
+    Directory, DirectoryListing, DirectoryOrPath, DirectoryItem, DirectoryChain, _norm_name
+)
 from botocore.exceptions import ClientError
 from xcon.provider import AwsProvider, ProviderChain, InternalLocalProviderCache
 from xboto import boto_clients
+from xboto.dependencies import boto_session
 log = logging.getLogger(__name__)
 
 
 @dataclasses.dataclass
 class _LocalSecretsManagerCache:
     directories: Dict[Directory, DirectoryListing] = dataclasses.field(default_factory=lambda: {})
-    available: Dict[Directory, DirectoryListing] = None
-    """ Items in here have None values, but it does list the dir/name of every item available
-        in the secrets manager.  So if the item is in here, you know you can grab it's value.
+    available: Dict[Directory, Dict[str, str]] = None
+    """ Directory -> lower-cased name -> original name, of every secret available
+        in the secrets manager.  So if the name is in here, you know you can grab it's value.
     """
 
 
@@ -32,9 +36,13 @@ class SecretsManagerProvider(AwsProvider):
         all the directories/providers when finding the value for a config name.
 
         It then uses `secretsmanager:GetSecretValue` as needed to get a specific secret value
-        when it's asked for, the first time. The secrets manager does not let us bulk-get
-        the secret values.  So that's why we list them first and cache that. And then only
-        query for specific secrets if we know they exist.
+        when it's asked for, the first time. So that's why we list them first and cache that.
+        And then only query for specific secrets if we know they exist.
+
+        The first time a value is needed from a directory with several secrets, we get all of
+        that directory's values at once via `secretsmanager:BatchGetSecretValue`
+        (see `SecretsManagerProvider.prefetch_values`). If that is not allowed/fails,
+        we go back to getting them one at a time.
 
         ## Things Left To Do
 
@@ -60,7 +68,21 @@ class SecretsManagerProvider(AwsProvider):
         However, since we are not currently not using `SecretsManagerProvider`, these are at
         a low-priority to do right now.
     """
+    attributes_to_skip_while_copying = ['_store_list_secrets_paginator']
     name = "secrets"
+    _store_list_secrets_paginator = None
+    _batch_get_failed = False
+    """ Set to True if we are not allowed to use `batch_get_secret_value` (or it does not exist),
+        so we don't keep trying it; see `SecretsManagerProvider.prefetch_values`.
+    """
+
+    @property
+    def _list_secrets_paginator(self):
+        paginator = self._store_list_secrets_paginator
+        if not paginator:
+            paginator = boto_clients.secretsmanager.get_paginator('list_secrets')
+            self._store_list_secrets_paginator = paginator
+        return paginator
 
     @property
     def local_cache(self) -> _LocalSecretsManagerCache:
@@ -69,31 +91,61 @@ class SecretsManagerProvider(AwsProvider):
         cacher = InternalLocalProviderCache.grab()
         return cacher.get_cache_for_provider(provider=self, cache_constructor=maker)
 
-    def _available_names_for_directory(self) -> Dict[Directory, DirectoryListing]:
-        """ A dictionary with a mapping of directory to directory list.
-            The list will initially have None as the item values. THis indicates that we
-            know the secret exists in AWS but we just have not gotten the value yet.
+    def _available_names_for_directory(self) -> Dict[Directory, Dict[str, str]]:
+        """ A dictionary with a mapping of directory to the names of the secrets
+            that exist in it (lower-cased name -> original name).
+
+            This indicates that we know the secret exists in AWS, we get it's value
+            when it's first asked for (see `SecretsManagerProvider.get_item`).
 
-            As you update get the values and update the items in the mapped listing,
-            we will keep them as-is. We only retrieve the initial listing if it does not
-            exist. Otherwise, we will keep returning the cached list and won't change and
-            items/values you update in it.
+            We only retrieve the names if we don't already have them.
+            Otherwise, we will keep returning the cached mapping.
         """
-        if self.local_cache.available is not None:
-            return self.local_cache.available
+        local_cache = self.local_cache
+        if local_cache.available is not None:
+            return local_cache.available
+
+        shared_listings = _shared_list_secrets_cache()
+        cache_key = _list_secrets_cache_key()
+        dir_to_names = shared_listings.get(cache_key) if cache_key else None
+        if dir_to_names is None:
+            dir_to_names = defaultdict(dict)
+            if self._list_available_names(dir_to_names) and cache_key:
+                shared_listings[cache_key] = dir_to_names
+
+        local_cache.available = dir_to_names
+
+        source = f"{self.name}-nameOnly"
+        for directory, names in dir_to_names.items():
+            self.log_about_items(
+                # Only needed if it's really logged.
+                items=lambda d=directory, n=names: (
+                    DirectoryItem(directory=d, name=name, source=source) for name in n.values()
+                ),
+                path=directory.path,
+                msg_prefix="Retrieved only name"
+            )
+
+        return dir_to_names
 
+    def _list_available_names(self, dir_to_names: Dict[Directory, Dict[str, str]]) -> bool:
+        """ Lists all the secrets we have access to via `list_secrets`, adding their
+            names to their directory's dict in `dir_to_names`
+            (lower-cased name -> original name).
+
+            Returns False if there was an error listing them (after `handle_aws_exception`
+            decided it's ok to continue with what we got).
+        """
         log.info("Getting full listing of available path/names in AWS Secrets Manager.")
-        dir_to_item_map = {}
+        from_path = Directory.from_path
         try:
-            paginator = boto_clients.secretsmanager.get_paginator('list_secrets')
-            response = paginator.paginate()
+            response = self._list_secrets_paginator.paginate()
 
             for page in response:
                 for secret in page['SecretList']:
                     full_path: str = secret['Name']
-                    split = full_path.split('/')
-                    name = split.pop()
-                    dir_path = '/'.join(split)
+                    # Same as splitting on `/` and re-joining all but the last part, in one go.
+                    dir_path, _, name = full_path.rpartition('/')
 
                     if not name:
                         log.warning(
@@ -102,39 +154,18 @@ class SecretsManagerProvider(AwsProvider):
                         )
                         continue
 
-                    # Create a directory item with None as the value, so that
-                    # we know it exists but we have not gotten the value yet.
-                    # [secrets manager only has string values, so None is good enough for this].
-                    item = DirectoryItem(
-                        directory=dir_path,
-                        # Just being paranoid, ensure it's a string.
-                        name=str(name),
-                        source=f"{self.name}-nameOnly"
-                    )
-                    directory = item.directory
-                    dir_listing = dir_to_item_map.get(directory, None)
-                    if not dir_listing:
-                        dir_listing = DirectoryListing(directory=directory)
-                        dir_to_item_map[directory] = dir_listing
-
-                    dir_listing.add_item(item)
+                    # We only need to know it exists for now, we get the value when needed.
+                    # Lower-cased just like `DirectoryItem.name`.
+                    dir_to_names[from_path(dir_path)][name.lower()] = name
         except Exception as e:
             # Will either re-raise the exception or handle it for us.
             # It will also communicate to us via marking the directory as error'd on us if needed.
             handle_aws_exception(
                 exception=e, provider=self, directory=Directory(path="list_secrets")
             )
+            return False
 
-        self.local_cache.available = dir_to_item_map
-
-        for dir_listing in dir_to_item_map.values():
-            self.log_about_items(
-                items=dir_listing.item_mapping().values(),
-                path=dir_listing.directory.path,
-                msg_prefix="Retrieved only name"
-            )
-
-        return dir_to_item_map
+        return True
 
     def get_item(
             self,
@@ -148,45 +179,47 @@ class SecretsManagerProvider(AwsProvider):
             return None
 
         directory = Directory.from_path(directory)
-        listing = self.local_cache.directories.get(directory)
+        # Getting `local_cache` is not free, only get it once.
+        directories = self.local_cache.directories
+        listing = directories.get(directory)
         if listing:
             item = listing.get_item(name)
             if item:
                 return item if item.value is not None else None
 
-        available = self._available_names_for_directory()
-        available_listing = available.get(directory)
-        if not available_listing:
-            return None
-
         # See if the item is available in the secrets manager.
         # Consider caching the available names in secret manager in Dynamo or some such.
-        item = available_listing.get_item(name)
-        if not item:
+        available_names = self._available_names_for_directory().get(directory)
+        if not available_names:
+            return None
+
+        original_name = available_names.get(_norm_name(name))
+        if original_name is None:
             return None
 
+        if listing is None and not self._batch_get_failed and _prefetch_directory_enabled():
+            # First value we need from this directory, get all of them in one go.
+            listing = self.prefetch_values(directory)
+            if listing is not None:
+                prefetched_item = listing.get_item(name)
+                if prefetched_item:
+                    return prefetched_item if prefetched_item.value is not None else None
+
         # Use original_name to grab the value from aws (to preserve original case of name).
-        item_path = f'{item.directory.path}/{item.original_name or item.name}'
+        item_path = f'{directory.path}/{original_name}'
         secret = None
         try:
             log.info(f"Getting value at SecretsManagerProvider path ({item_path})")
             item_value: Dict[str, Any] = boto_clients.secretsmanager.get_secret_value(
                 SecretId=item_path
             )
-            secret = item_value.get('SecretString')
-            if secret is None:
-                binary_data = item_value.get('SecretBinary')
-                if binary_data is not None:
-                    secret = base64.b64decode(binary_data)
-
+            secret = _secret_from_value(item_value)
         except ClientError as e:
             if not (e.response['Error']['Code'] == 'ResourceNotFoundException'):
                 handle_aws_exception(exception=e, provider=self, directory=directory)
 
-        listing = self.local_cache.directories.get(directory)
-        if not listing:
-            listing = DirectoryListing(directory=directory)
-            self.local_cache.directories[directory] = listing
+        if listing is None:
+            listing = directories.setdefault(directory, DirectoryListing(directory=directory))
 
         item = DirectoryItem(
             directory=directory, name=name, value=secret,
@@ -198,6 +231,69 @@ class SecretsManagerProvider(AwsProvider):
 
         return item
 
+    def prefetch_values(self, directory: Directory) -> Optional[DirectoryListing]:
+        """ Gets the values of all the secrets available in `directory` via
+            `batch_get_secret_value` (20 at a time, the most it allows),
+            and puts them into our local cache.
+
+            `SecretsManagerProvider.get_item` only calls this when
+            `xcon.conf.XconSettings.secrets_manager_prefetch_directory` is enabled.
+
+            Returns the directory's listing, or None if there was nothing to get
+            or the batch-get failed; we then get the values one at a time instead.
+        """
+        available_names = self._available_names_for_directory().get(directory)
+        if not available_names:
+            return None
+
+        path_to_name = {
+            f'{directory.path}/{original_name}': original_name
+            for original_name in available_names.values()
+        }
+        if len(path_to_name) < 2:
+            # Nothing to gain over getting it by its self.
+            return None
+
+        paths = list(path_to_name)
+        items = []
+        try:
+            log.info(
+                f"Getting values at SecretsManagerProvider directory ({directory.path}) "
+                f"via batch_get_secret_value."
+            )
+            for i in range(0, len(paths), _BATCH_GET_MAX_SECRETS):
+                response = boto_clients.secretsmanager.batch_get_secret_value(
+                    SecretIdList=paths[i:i + _BATCH_GET_MAX_SECRETS]
+                )
+                for secret_value in response.get('SecretValues', ()):
+                    original_name = path_to_name.get(secret_value.get('Name'))
+                    if original_name is None:
+                        continue
+                    items.append(DirectoryItem(
+                        directory=directory, name=original_name,
+                        value=_secret_from_value(secret_value), source=self.name
+                    ))
+        except Exception as e:
+            # Getting them in one go is only an optimization (and needs the
+            # `secretsmanager:BatchGetSecretValue` permission, which older setups won't have);
+            # we will get them one at a time instead.
+            log.info(
+                f"Unable to get values via batch_get_secret_value, will get them one at a "
+                f"time instead; error: {e}"
+            )
+            if _batch_get_unsupported(e):
+                # Won't work next time either; other errors could be transient,
+                # so for those we only fall back for this call.
+                self._batch_get_failed = True
+            return None
+
+        # Any secret that had an error (`response['Errors']`) is not in here,
+        # it will be retrieved on it's own if it's asked for.
+        listing = DirectoryListing(directory=directory, items=items)
+        self.local_cache.directories[directory] = listing
+        self.log_about_items(items=items, path=directory.path)
+        return listing
+
     def retrieved_items_map(
             self, directory: DirectoryOrPath
     ) -> Optional[Mapping[str, DirectoryItem]]:
@@ -206,3 +302,71 @@ class SecretsManagerProvider(AwsProvider):
         if listing is None:
             return None
         return listing.item_mapping()
+
+
+def _shared_list_secrets_cache() -> Dict[tuple, Dict[Directory, Dict[str, str]]]:
+    """ `(access_key, region, endpoint_url)` -> directory -> names from `list_secrets`.
+
+        Shared by all `SecretsManagerProvider`'s using the current `InternalLocalProviderCache`,
+        so it expires/resets along with everything else in it.
+    """
+    return InternalLocalProviderCache.grab().get_cache_for_provider(
+        provider=SecretsManagerProvider, cache_constructor=lambda c: {}
+    )
+
+
+def _list_secrets_cache_key() -> Optional[tuple]:
+    """ Identifies the aws account/region we would list the secrets from,
+        or None if we don't know (ie: no credentials).
+    """
+    try:
+        # Client first; creating it resolves the session's credentials, which it then keeps.
+        client_meta = boto_clients.secretsmanager.meta
+        credentials = boto_session.session.get_credentials()
+        if credentials is None:
+            return None
+        return credentials.access_key, client_meta.region_name, client_meta.endpoint_url
+    except Exception as e:
+        log.debug(f"Unable to get identity to cache list_secrets with, error: {e}")
+        return None
+
+
+_BATCH_GET_MAX_SECRETS = 20
+""" Most secrets `batch_get_secret_value` allows in a single call. """
+
+
+_BATCH_GET_UNSUPPORTED_ERROR_CODES = frozenset({
+    'AccessDeniedException', 'UnknownOperationException', 'InvalidAction'
+})
+""" `ClientError` codes that mean we can't use `batch_get_secret_value` at all,
+    see `_batch_get_unsupported`.
+"""
+
+
+def _prefetch_directory_enabled() -> bool:
+    """ See `xcon.conf.XconSettings.secrets_manager_prefetch_directory`. """
+    # Importing here to avoid circular imports.
+    from xcon import xcon_settings
+    return bool(xcon_settings.secrets_manager_prefetch_directory)
+
+
+def _batch_get_unsupported(error: Exception) -> bool:
+    """ True if `error` from `batch_get_secret_value` means it will never work for us
+        (no permission, or the service/client does not know about the operation).
+    """
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code') in _BATCH_GET_UNSUPPORTED_ERROR_CODES
+    # Older botocore clients don't have the method; moto raises NotImplementedError for it.
+    return isinstance(error, (AttributeError, NotImplementedError))
+
+
+def _secret_from_value(secret_value: Dict[str, Any]) -> Any:
+    """ Secret (string or decoded binary) from a `get_secret_value` response
+        (or one of the `batch_get_secret_value` response's `SecretValues`).
+    """
+    secret = secret_value.get('SecretString')
+    if secret is None:
+        binary_data = secret_value.get('SecretBinary')
+        if binary_data is not None:
+            secret = base64.b64decode(binary_data)
+    return secret
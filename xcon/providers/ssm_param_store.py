@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Mapping, Iterable, Dict, Callable
 
 from xboto import boto_clients
 
@@ -31,10 +32,53 @@ class SsmParamStoreProvider(AwsProvider):
             provider_chain: ProviderChain,
             environ: Directory
     ) -> Optional[DirectoryItem]:
+        directory = Directory.from_path(directory)
         if directory is None:
             return None
+
+        # If we need to look up the directory, we get any other directories
+        # in the chain we have not looked up yet at the same time (we will likely need them).
+        if directory_chain and self.local_cache.get(directory) is None:
+            self.prefetch_directories([directory, *directory_chain.directories])
+
         return self._item_only_for_directory(name=name, directory=directory)
 
+    def prefetch_directories(self, directories: Iterable[DirectoryOrPath]):
+        """ Looks up the listings for any of `directories` we have not retrieved yet and puts
+            them into our local cache. If there is more than one, we query them concurrently
+            (each in it's own thread), so it takes about the same time as querying one of them.
+
+            `SsmParamStoreProvider.get_item` calls this with the directory chain when it needs
+            to look up a directory.
+        """
+        local_cache = self.local_cache
+        to_fetch = []
+        for directory in directories:
+            directory = Directory.from_path(directory)
+            if directory and directory not in local_cache and directory not in to_fetch:
+                to_fetch.append(directory)
+
+        if len(to_fetch) < 2:
+            # `_item_only_for_directory` will look up a single directory when it needs it.
+            return
+
+        # Grab it here, worker threads won't have our current context
+        # (boto clients/paginators are thread-safe, the threads can share it).
+        try:
+            paginator = self._get_params_paginator
+        except Exception:
+            # Can't create the client (ie: no region); leave it to `_item_only_for_directory`,
+            # it handles/reports the error for the directory it needs.
+            return
+        max_workers = min(_PREFETCH_MAX_WORKERS, len(to_fetch))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (d, executor.submit(self._get_directory_items, d, paginator)) for d in to_fetch
+            ]
+
+        for directory, future in futures:
+            self._store_listing(directory, future.result)
+
     def _item_only_for_directory(
             self, name: str, directory: DirectoryOrPath
     ) -> Optional[DirectoryItem]:
@@ -46,25 +90,47 @@ class SsmParamStoreProvider(AwsProvider):
         if listing:
             return listing.get_item(name)
 
-        items = []
+        listing = self._store_listing(
+            directory, lambda: self._get_directory_items(directory, self._get_params_paginator)
+        )
+        return listing.get_item(name)
+
+    def _get_directory_items(
+            self, directory: Directory, paginator
+    ) -> Dict[str, DirectoryItem]:
+        """ Gets the items in `directory` from SSM, as a `DirectoryItem.name` -> item dict;
+            may be called from a worker thread.
+        """
+        items = {}
+        source = self.name
+        # We need to lookup the directory listing from the SSM param store.
+        pages = paginator.paginate(
+            Path=directory.path,
+            Recursive=False,
+            WithDecryption=True,
+        )
+
+        for p in pages:
+            for item_info in p['Parameters']:
+                item = DirectoryItem(
+                    directory=directory,
+                    name=item_info['Name'].rpartition('/')[2],
+                    value=item_info['Value'],
+                    source=source
+                )
+                items[item.name] = item
+        return items
+
+    def _store_listing(
+            self, directory: Directory, get_items: Callable[[], Dict[str, DirectoryItem]]
+    ) -> DirectoryListing:
+        """ Puts a listing for `directory` into our local cache with the items from `get_items`;
+            if that raises an error we are ignoring (see `handle_aws_exception`) the listing
+            will be empty.
+        """
+        items = {}
         try:
-            # We need to lookup the directory listing from Secrets Manager.
-            pages = self._get_params_paginator.paginate(
-                Path=directory.path,
-                Recursive=False,
-                WithDecryption=True,
-            )
-
-            for p in pages:
-                for item_info in p['Parameters']:
-                    item_path: str = item_info['Name']
-                    item = DirectoryItem(
-                        directory=directory,
-                        name=item_path.split("/")[-1],
-                        value=item_info['Value'],
-                        source=self.name
-                    )
-                    items.append(item)
+            items = get_items()
         except Exception as e:
             # This will either re-raise error....
             # or handle it and we will continue/ignore the error.
@@ -73,7 +139,7 @@ class SsmParamStoreProvider(AwsProvider):
         # If we got an error, `items` will be empty.
         # In this case, in the future, we won't try to retrieve this directory since we are
         # setting it blank here.
-        listing = DirectoryListing(directory=directory, items=items)
+        listing = DirectoryListing(directory=directory, item_map=items)
 
         self.log_about_items(
             items=listing.item_mapping().values(),
@@ -81,7 +147,7 @@ class SsmParamStoreProvider(AwsProvider):
         )
 
         self.local_cache[directory] = listing
-        return listing.get_item(name)
+        return listing
 
     def retrieved_items_map(
             self, directory: DirectoryOrPath
@@ -91,3 +157,7 @@ class SsmParamStoreProvider(AwsProvider):
         if listing is None:
             return None
         return listing.item_mapping()
+
+
+_PREFETCH_MAX_WORKERS = 8
+""" Most threads `SsmParamStoreProvider.prefetch_directories` will use at once. """
@@ -86,8 +86,16 @@ def xcon_test_config(xinject_test_context):
     # Have a base-line for each unit-test before it executes
     # (The xyn_context fixture throws always all resource objects before each test,
     #  so configuring config with base-line values before each unit test)
-    _setup_config_for_testing()
-    return Config.grab()
+    #
+    # This intentionally stays function-scoped: `xcon_settings` and `Config` are
+    # per-context resources, and `xinject_test_context` gives every test a brand-new
+    # context. A session-scoped fixture (or a run-once flag) would only configure the
+    # first test's context, leaving every later test with the real default providers.
+    return _setup_config_for_testing()
+
+
+_TESTING_PROVIDERS = (EnvironmentalProvider,)
+""" Providers used by default in unit tests, see `_setup_config_for_testing`. """
 
 
 def _setup_config_for_testing():
@@ -96,7 +104,7 @@ def _setup_config_for_testing():
 
     # We default to ONLY use 'EnvironmentalProvider'.
     # We tell it not to use a cacher or parent, not testing those aspects in this test.
-    xcon_settings.providers = [EnvironmentalProvider]
+    xcon_settings.providers = _TESTING_PROVIDERS
 
     # We have no providers, and so nothing should be cached....
     # But to be safe and make it obvious, explicitly disable cacher by default for unit-tests.
@@ -105,7 +113,18 @@ def _setup_config_for_testing():
     return config
 
 
-# Setup a base-line for config before pytest collects the unit tests.
-# This executes before any conftest.py, so it sets up a base-line,
-# during import time of project py-test related files.
-_setup_config_for_testing()
+@pytest.hookimpl(tryfirst=True)
+def pytest_load_initial_conftests(early_config, parser, args):
+    # Setup a base-line for config before pytest collects the unit tests.
+    # This executes before any conftest.py is imported, so it sets up a base-line
+    # during import time of project py-test related files
+    # (but only once pytest is using us as a plugin, not whenever we are imported).
+    _setup_config_for_testing()
+
+
+def pytest_configure(config):
+    # `pytest_load_initial_conftests` is only called for plugins pytest knows about
+    # up-front (setuptools entry-point or early `-p xcon.pytest_plugin`); when a project
+    # loads us via `pytest_plugins = [...]` in a conftest.py it never fires, so set up
+    # the base-line here too (before any test modules are imported during collection).
+    _setup_config_for_testing()
@@ -1,6 +1,25 @@
+import functools
+import logging
 from logging import getLogger
+from typing import Tuple, Optional, Dict, Any
 
 log = getLogger(__name__)
+# Bound once, `ssm_or_secrets_change_event` is called for every change event.
+_log_info = log.info
+_log_is_enabled_for = log.isEnabledFor
+
+_PATH_LOOKUPS: Tuple[Tuple[str, Optional[str]], ...] = (
+    ('name', None),
+    ('responseElements', 'name'),
+    ('requestParameters', 'name'),
+    ('requestParameters', 'secretId'),
+)
+""" Where to look for the path in an event's `detail`, in order; (key, key inside that dict),
+    see `_path_from_detail`.
+"""
+
+_NON_EXISTENT_PATH = '/_nonExistent'
+""" Path of the non-existent directory, cached items that are not in any directory use it. """
 
 
 def ssm_or_secrets_change_event(event, context):
@@ -16,58 +35,30 @@ def ssm_or_secrets_change_event(event, context):
 
     detail->requestParameters->secretId->/test/dev/testing-experiment-2
     """
-    detail = get_or_blank_dict(event, 'detail')
-    path = detail.get('name')
-
-    if not path:
-        path = get_or_blank_dict(detail, 'responseElements').get('name')
-
-    if not path:
-        path = get_or_blank_dict(detail, 'requestParameters').get('name')
-
-    if not path:
-        path = get_or_blank_dict(detail, 'requestParameters').get('secretId')
+    detail = event.get('detail') if isinstance(event, dict) else None
+    path = _path_from_detail(detail) if isinstance(detail, dict) else None
 
     if not path:
         raise AttributeError(
             f"Could not find attribute with a path for event {event}.",
         )
 
-    if ':' in path:
-        # Paths should NEVER have a colon in them,
-        # so this means we have a value that is in this format (all one line):
-        #
-        # arn:aws:secretsmanager:us-east-1:972731226928
-        #   :secret:/test/joshorr/testing-experiment-2-Pwqh7v
-
-        # This will extract the part of the ARN that is the path we care about.
-        path = '-'.join(path.split(':')[-1].split('-')[0:-1])
-
-    path_components = path.split('/')
-
-    if len(path_components) <= 1:
-        raise ValueError(
-            f"Path ({path}) in event did not have at least two path components, "
-            f"it instead had ({len(path_components)}; must have a directory and a var-name. "
-            f"If it turns out we do have SSM/Secrets like this we want to keep then turn this "
-            f"error into a warning instead.",
-        )
-
-    directory = '/'.join(path_components[0:-1])
-    var_name = str(path_components[-1])
+    path, directory, var_name = _parse_path(path)
 
     query = {
         'real_name': var_name.lower(),  # names are always lower-case in config cache.
-        'real_directory': ['/_nonExistent', directory]  # Directories keep their case.
+        'real_directory': [_NON_EXISTENT_PATH, directory]  # Directories keep their case.
     }
 
-    log.info(
-        f"From source ({event.get('source')}), "
-        f"got a change event for path ({path}); "
-        f"will query cache table with ({query}); "
-        f"via event ({event}).",
-        extra={'event': event, 'query': query, 'path': path}
-    )
+    # Formatting the whole event is not free, only do it if it will really be logged.
+    if _log_is_enabled_for(logging.INFO):
+        _log_info(
+            f"From source ({event.get('source')}), "
+            f"got a change event for path ({path}); "
+            f"will query cache table with ({query}); "
+            f"via event ({event}).",
+            extra={'event': event, 'query': query, 'path': path}
+        )
 
     # todo: Copy the query-boto-structure out of library for get/delete calls below.
 
@@ -78,18 +69,49 @@ def ssm_or_secrets_change_event(event, context):
     # ConfigCacheItem.api.client.delete_objs(items)
 
 
-def get_or_blank_dict(dict_value, key):
-    if not dict_value:
-        return {}
+def _path_from_detail(detail: Dict[str, Any]) -> Any:
+    """ First path found in `detail` via `_PATH_LOOKUPS`, or None. """
+    for key, inner_key in _PATH_LOOKUPS:
+        value = detail.get(key)
+        if inner_key is None:
+            if value:
+                return value
+        elif isinstance(value, dict):
+            value = value.get(inner_key)
+            if value:
+                return value
+    return None
 
-    if not isinstance(dict_value, dict):
-        return {}
 
-    value = dict_value.get(key, None)
-    if not value:
-        return {}
+@functools.lru_cache(maxsize=1024)
+def _parse_path(path: str) -> Tuple[str, str, str]:
+    """ Returns (path, directory, var_name) for a path from a change event
+        (see `ssm_or_secrets_change_event`); the path will have any ARN parts removed.
 
-    if not isinstance(value, dict):
-        return {}
-    return value
+        Events for the same paths keep coming in, so we remember the most recent ones.
+    """
+    event_path = path
+    last_colon = path.rfind(':')
+    if last_colon >= 0:
+        # Paths should NEVER have a colon in them,
+        # so this means we have a value that is in this format (all one line):
+        #
+        # arn:aws:secretsmanager:us-east-1:972731226928
+        #   :secret:/test/joshorr/testing-experiment-2-Pwqh7v
+
+        # This will extract the part of the ARN that is the path we care about
+        # (after the last colon, without the `-` suffix secrets manager adds to it).
+        path = path[last_colon + 1:].rpartition('-')[0]
+
+    # Same as splitting on `/` and re-joining all but the last part, in one go.
+    directory, sep, var_name = path.rpartition('/')
+
+    if not sep:
+        raise ValueError(
+            f"Path ({path}) in event (from {event_path!r}) did not have at least two path "
+            f"components, it instead had 1; must have a directory and a var-name. "
+            f"If it turns out we do have SSM/Secrets like this we want to keep then turn this "
+            f"error into a warning instead.",
+        )
 
+    return path, directory, var_name
@@ -1,22 +1,47 @@
+from __future__ import annotations
+
+from copy import copy
 from typing import Dict, Any
 from xsentinels.default import DefaultType
-from typing import Dict, Union, Type, TypeVar
+from typing import Union, TypeVar, Iterable
 
 
 T = TypeVar('T')
 
 JsonDict = Dict[str, Any]
 
-# todo: Put my `OrderedSet` class into library and use that instead.
-OrderedSet = Dict[T, Type[None]]
-"""
-Internally we are using a dict as an ordered-set; python 3.7 guarantees dicts
-keep their insertion order. So these are ordered sets of values inside a dict.
-They can also have the Default value as one of their values. It's replaced by
-the parent's values when resolved/used.
 
-.. todo:: Perhaps make an OrderedSet as a dict-subclass, with a few extra nice set-based methods?
-"""
+class OrderedSet(Dict[T, None]):
+    """
+    Internally we are using a dict as an ordered-set; python 3.7 guarantees dicts
+    keep their insertion order. So these are ordered sets of values inside a dict
+    (the values are the keys, the dict's values are always `None`).
+    They can also have the Default value as one of their values. It's replaced by
+    the parent's values when resolved/used.
+
+    Use `OrderedSet.fromkeys` to make one out of an iterable of values.
+    `OrderedSet.update` and `|` take values (not a mapping); since we use
+    `dict.fromkeys`/`dict.update` to add them, it's done in C instead of a python loop.
+    """
+    __slots__ = ()
+
+    def add(self, value: T):
+        """ Adds `value` to end, if it's not already in self (existing order won't change). """
+        self[value] = None
+
+    def update(self, values: Iterable[T]):
+        """ Adds `values` to end, like calling `OrderedSet.add` for each one. """
+        dict.update(self, dict.fromkeys(values))
+
+    def __or__(self, values: Iterable[T]) -> OrderedSet[T]:
+        result = copy(self)
+        result.update(values)
+        return result
+
+    def __ior__(self, values: Iterable[T]) -> OrderedSet[T]:
+        self.update(values)
+        return self
+
 
 OrderedDefaultSet = OrderedSet[Union[T, DefaultType]]
 """